@@ -28,15 +28,51 @@ class Gender(Enum):
 # Google Drive API configuration
 GOOGLE_DRIVE_SCOPES = ['https://www.googleapis.com/auth/drive.file']
 
+# Concurrent Google Drive API requests (calls are latency-bound)
+GDRIVE_MAX_WORKERS = 8
+# Background Google Drive checks/uploads overlapping with scraping
+GDRIVE_BACKGROUND_WORKERS = 4
+# Files up to this size go up in one multipart request instead of a resumable session
+GDRIVE_RESUMABLE_THRESHOLD = 5 * 1024 * 1024
+
+# Discord accepts at most this many embeds per webhook message
+DISCORD_MAX_EMBEDS = 10
+# ...with at most this many characters of text across all of them
+DISCORD_MAX_MESSAGE_CHARS = 6000
+# Longest description Discord accepts in one embed
+DISCORD_MAX_DESCRIPTION = 4096
+
 # NCAA URL patterns
 NCAA_BASE_URL = "https://stats.ncaa.org/contests/livestream_scoreboards"
 NCAA_OLD_BASE_URL = "https://www.ncaa.com/scoreboard/basketball-{gender}/{division}/{date}/all-conf"  # Legacy
+GAME_LINK_TEMPLATE = "https://stats.ncaa.org/contests/{}/individual_stats"  # Filled with the contest ID
+
+# Headers for plain HTTP requests to stats.ncaa.org
+HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+HTTP_TIMEOUT = 10
+HTTP_POOL_SIZE = 8  # Keep-alive connections per session
 
 # Default values
 DEFAULT_OUTPUT_DIR = "scraped_data"
 DEFAULT_TOKEN_FILE = "token.pickle"
 DEFAULT_REDIRECT_URI = "urn:ietf:wg:oauth:2.0:oob"
 
+# Parsed games cached across runs, relative to the output directory
+GAME_CACHE_FILE = ".cache/games.sqlite"
+
+# Division each game link was scraped in, kept across runs, relative to the output directory
+VISITED_LINKS_FILE = ".cache/visited.sqlite"
+
+# Scraped games buffered per CSV before they are appended in one write
+CSV_FLUSH_GAMES = 25
+
+# Rows parsed at a time when scanning a CSV's game IDs, bounding memory for large files
+CSV_READ_CHUNK_ROWS = 50000
+
 # Selenium configuration
 DEFAULT_WAIT_TIMEOUT = 15
 DEFAULT_SLEEP_TIME = 2
@@ -27,6 +27,10 @@ class ScraperConfig:
     output_dir: str
     wait_timeout: int = 15
     sleep_time: int = 2
+    max_workers: int = 3
+    requests_per_second: float = 2.0
+    metrics_port: int = 0
+    csv_engine: str = "c"
     
     # Logging
     log_level: str = "INFO"
@@ -49,6 +53,10 @@ class ScraperConfig:
             output_dir=os.getenv('OUTPUT_DIR', DEFAULT_OUTPUT_DIR),
             wait_timeout=int(os.getenv('WAIT_TIMEOUT', '15')),
             sleep_time=int(os.getenv('SLEEP_TIME', '2')),
+            max_workers=int(os.getenv('MAX_WORKERS', '3')),
+            requests_per_second=float(os.getenv('REQUESTS_PER_SECOND', '2.0')),
+            metrics_port=int(os.getenv('METRICS_PORT', '0')),
+            csv_engine=os.getenv('CSV_ENGINE', 'c'),
             log_level=os.getenv('LOG_LEVEL', 'INFO'),
             upload_to_gdrive=os.getenv('UPLOAD_TO_GDRIVE', 'true').lower() == 'true'
         )
@@ -2,10 +2,20 @@
 
 import json
 import logging
+import mmap
 import time
-from typing import Dict, List, Set
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Set, Tuple
 from pathlib import Path
 
+from selenium.common.exceptions import WebDriverException
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .config import get_config, Division, Gender
 from .scrapers import NCAAScraper
 from .scrapers.selenium_utils import SeleniumUtils
@@ -14,10 +24,21 @@ from datetime import date, timedelta
 
 logger = logging.getLogger(__name__)
 
+# Mapping files at least this large are memory-mapped instead of read into a bytes copy
+MMAP_THRESHOLD_BYTES = 32 * 1024 * 1024
+
+# Per-scoreboard game-link cache, kept next to the mapping file
+CACHE_DIR_NAME = ".cache"
+CACHE_TTL_SECONDS = 6 * 60 * 60
+
+# Primary division precedence for games listed under several divisions
+DIVISION_ORDER = ('d1', 'd2', 'd3')
+
 
 def discover_games(
     target_date: date,
-    output_file: str = "discovery/game_links_mapping.json"
+    output_file: str = "discovery/game_links_mapping.json",
+    scraper: Optional[NCAAScraper] = None
 ) -> Dict:
     """
     Discover all game links from all divisions and genders for a given date.
@@ -26,12 +47,14 @@ def discover_games(
     Args:
         target_date: Date to discover games for
         output_file: Path to save the mapping JSON file
+        scraper: Scraper to reuse (a new one is created from the environment config if omitted)
         
     Returns:
         Dictionary mapping game links to their divisions
     """
-    config = get_config()
-    scraper = NCAAScraper(config)
+    if scraper is None:
+        scraper = NCAAScraper(get_config())
+    config = scraper.config
     
     # Generate all URLs for the date
     date_str = format_date_for_url(target_date)
@@ -42,88 +65,56 @@ def discover_games(
     logger.info(f"Discovering games for {target_date}: {len(urls)} scoreboard URLs")
     
     # Map to store game_link -> list of (division, gender) tuples
-    game_links_map: Dict[str, List[Dict[str, str]]] = {}
-    url_to_division_gender: Dict[str, Dict[str, str]] = {}
+    game_links_map: Dict[str, List[Dict[str, str]]] = defaultdict(list)
     
-    # Extract game links from each URL
+    # Scoreboards are independent, so fetch them concurrently. The scraper keeps one
+    # driver per worker thread (created only if the HTTP fetch isn't enough).
+    results: Dict[str, List[Tuple[str, Dict[str, str]]]] = {}
+    max_workers = max(1, min(config.max_workers, len(urls)))
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            date_iso = target_date.isoformat()
+            cache_dir = Path(output_file).parent / CACHE_DIR_NAME
+            futures = {
+                executor.submit(_extract_for_url, scraper, url, date_iso, cache_dir): url
+                for url in urls
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+    finally:
+        scraper.quit_all_drivers()
+    
+    # Merge in URL order so the division order stays deterministic
     for url in urls:
-        try:
-            components = parse_url_components(url)
-            division = components['division']
-            gender = components['gender']
-            
-            logger.info(f"Extracting game links from {division} {gender}...")
-            
-            # Initialize driver
-            try:
-                scraper.driver = SeleniumUtils.create_driver(headless=True, max_retries=3)
-            except Exception as e:
-                logger.error(f"Failed to initialize WebDriver for {url}: {e}")
-                continue
-            
-            try:
-                # Load scoreboard page
-                if not scraper._load_scoreboard_page(url, division, gender, f"{components['year']}-{components['month']}-{components['day']}"):
-                    logger.warning(f"Failed to load scoreboard page: {url}")
-                    continue
-                
-                # Extract game links
-                game_links = scraper._extract_game_links(url)
-                
-                if not game_links:
-                    logger.warning(f"No game links found for {url}")
-                    continue
-                
-                logger.info(f"Found {len(game_links)} game links for {division} {gender}")
-                
-                # Store game links with their division/gender
-                for game_link in game_links:
-                    if game_link not in game_links_map:
-                        game_links_map[game_link] = []
-                    game_links_map[game_link].append({
-                        'division': division,
-                        'gender': gender
-                    })
-                
-            finally:
-                # Cleanup driver
-                if scraper.driver:
-                    SeleniumUtils.safe_quit_driver(scraper.driver)
-                    scraper.driver = None
-                    SeleniumUtils._cleanup_driver_resources()
-                    time.sleep(1)  # Brief pause between URLs
-                    
-        except Exception as e:
-            logger.error(f"Error processing URL {url}: {e}")
-            continue
-    
-    # Identify duplicates and determine primary division
-    # Primary division is the first one we encounter (D1 > D2 > D3)
-    division_order = {'d1': 1, 'd2': 2, 'd3': 3}
+        for game_link, combo in results.get(url, []):
+            game_links_map[game_link].append(combo)
     
+    # Identify duplicates and determine primary division (D1 > D2 > D3)
     duplicate_mapping = {}
+    duplicate_games = 0
     for game_link, divisions_list in game_links_map.items():
-        # Sort divisions by order (D1 first)
-        sorted_divisions = sorted(
-            divisions_list,
-            key=lambda x: division_order.get(x['division'], 999)
-        )
+        if len(divisions_list) > 1:
+            # At most a handful of entries: order them with a fixed scan over divisions
+            ordered = [d for div in DIVISION_ORDER for d in divisions_list if d['division'] == div]
+            ordered += [d for d in divisions_list if d['division'] not in DIVISION_ORDER]
+        else:
+            ordered = divisions_list
         
-        primary = sorted_divisions[0]
-        is_duplicate = len(sorted_divisions) > 1
+        primary = ordered[0]
+        is_duplicate = len(ordered) > 1
+        duplicate_games += is_duplicate
         
         duplicate_mapping[game_link] = {
             'primary_division': primary['division'],
             'primary_gender': primary['gender'],
-            'divisions': [d['division'] for d in sorted_divisions],
-            'genders': [d['gender'] for d in sorted_divisions],
+            'divisions': [d['division'] for d in ordered],
+            'genders': [d['gender'] for d in ordered],
             'is_duplicate': is_duplicate,
-            'all_combinations': sorted_divisions
+            'all_combinations': ordered
         }
     
     # Count statistics
     total_games = len(duplicate_mapping)
-    duplicate_games = sum(1 for v in duplicate_mapping.values() if v['is_duplicate'])
     
     logger.info(f"Discovery complete: {total_games} unique games found")
     logger.info(f"  - {duplicate_games} games appear in multiple divisions")
@@ -134,25 +125,180 @@ def discover_games(
         'date': target_date.isoformat(),
         'total_games': total_games,
         'duplicate_games': duplicate_games,
-        'game_links': duplicate_mapping
+        'game_links': duplicate_mapping,
+        'by_combo': _build_combo_index(duplicate_mapping)
     }
     
     # Save to file
     output_path = Path(output_file)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_path, 'w') as f:
-        json.dump(result, f, indent=2)
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, 'w') as f:
+            json.dump(result, f, indent=2)
     
     logger.info(f"Saved game links mapping to {output_path.absolute()}")
     
     return result
 
 
+def _extract_for_url(
+    scraper: NCAAScraper,
+    url: str,
+    date_iso: str,
+    cache_dir: Optional[Path] = None
+) -> List[Tuple[str, Dict[str, str]]]:
+    """
+    Extract game links from a single scoreboard URL.
+    
+    Args:
+        scraper: Scraper whose driver for the calling thread is used
+        url: Scoreboard URL
+        date_iso: Scoreboard date in YYYY-MM-DD format
+        cache_dir: Directory for cached game-link lists (None disables caching)
+        
+    Returns:
+        List of (game_link, {'division', 'gender'}) pairs (empty on error)
+    """
+    try:
+        components = parse_url_components(url)
+        division = components.division
+        gender = components.gender
+        
+        logger.info("Extracting game links from %s %s...", division, gender)
+        
+        cache_path = cache_dir / f"{date_iso}_{division}_{gender}.json" if cache_dir else None
+        game_links = _read_cached_links(cache_path, date_iso) if cache_path else None
+        if game_links:
+            logger.info("Using %d cached game links for %s %s", len(game_links), division, gender)
+            return [(game_link, {'division': division, 'gender': gender}) for game_link in game_links]
+        
+        # Scoreboards are server-rendered, so try a plain HTTP fetch before starting Chrome
+        game_links = scraper._try_http_extract(url)
+        
+        if not game_links:
+            if not scraper.driver:
+                scraper.driver = SeleniumUtils.create_driver(headless=True, max_retries=3)
+            try:
+                game_links = _extract_links_with_recovery(scraper, url, division, gender, date_iso)
+            finally:
+                # Isolate session state between scoreboards
+                if scraper.driver:
+                    try:
+                        scraper.driver.delete_all_cookies()
+                    except Exception:
+                        pass
+        
+        if not game_links:
+            logger.warning("No game links found for %s", url)
+            return []
+        
+        logger.info("Found %d game links for %s %s", len(game_links), division, gender)
+        if cache_path:
+            _write_cached_links(cache_path, game_links)
+        return [(game_link, {'division': division, 'gender': gender}) for game_link in game_links]
+        
+    except Exception as e:
+        logger.error("Error processing URL %s: %s", url, e)
+        return []
+
+
+def _read_cached_links(cache_path: Path, date_iso: str) -> Optional[List[str]]:
+    """
+    Read a cached game-link list if it is still fresh.
+    
+    Scoreboards don't change once their date is over, so entries written after
+    that never expire; entries written on or before the game date are
+    refetched after CACHE_TTL_SECONDS.
+    
+    Args:
+        cache_path: Cache file for one date/division/gender
+        date_iso: Scoreboard date in YYYY-MM-DD format
+        
+    Returns:
+        Cached game links, or None if missing, stale or unreadable
+    """
+    try:
+        if not cache_path.exists():
+            return None
+        
+        mtime = cache_path.stat().st_mtime
+        if date.fromtimestamp(mtime) <= date.fromisoformat(date_iso):
+            if time.time() - mtime > CACHE_TTL_SECONDS:
+                return None
+        
+        data = cache_path.read_bytes()
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable discovery cache {cache_path}: {e}")
+        return None
+
+
+def _write_cached_links(cache_path: Path, game_links: List[str]):
+    """Write a game-link list to the discovery cache (failures are only logged)."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        if orjson is not None:
+            cache_path.write_bytes(orjson.dumps(game_links))
+        else:
+            cache_path.write_text(json.dumps(game_links))
+    except Exception as e:
+        logger.warning(f"Could not write discovery cache {cache_path}: {e}")
+
+
+def _extract_links_with_recovery(
+    scraper: NCAAScraper,
+    url: str,
+    division: str,
+    gender: str,
+    date_str: str
+) -> List[str]:
+    """
+    Load a scoreboard and extract its game links, recreating the driver once on session loss.
+    
+    Args:
+        scraper: Scraper whose driver is used
+        url: Scoreboard URL
+        division: Division (d1, d2, d3)
+        gender: Gender (men, women)
+        date_str: Date in YYYY-MM-DD format
+        
+    Returns:
+        List of game links (empty if the page could not be loaded)
+    """
+    for attempt in range(2):
+        try:
+            if scraper._load_scoreboard_page(url, division, gender, date_str):
+                return scraper._extract_game_links(url)
+            # Raises if the session died while loading the page
+            scraper.driver.current_url
+            logger.warning(f"Failed to load scoreboard page: {url}")
+            return []
+        except WebDriverException as e:
+            if attempt > 0:
+                raise
+            logger.warning(f"Driver session lost while processing {url}, recreating: {e}")
+            SeleniumUtils.safe_quit_driver(scraper.driver)
+            scraper.driver = SeleniumUtils.create_driver(headless=True, max_retries=3)
+    return []
+
+
 def load_game_links_mapping(mapping_file: str) -> Dict:
     """Load game links mapping from JSON file."""
-    with open(mapping_file, 'r') as f:
-        return json.load(f)
+    if orjson is None:
+        with open(mapping_file, 'r') as f:
+            return json.load(f)
+    
+    path = Path(mapping_file)
+    if path.stat().st_size < MMAP_THRESHOLD_BYTES:
+        return orjson.loads(path.read_bytes())
+    
+    # Large (e.g. season-long) mappings: parse straight from the page cache
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            return orjson.loads(view)
 
 
 def get_games_for_division_gender(
@@ -171,16 +317,38 @@ def get_games_for_division_gender(
     Returns:
         List of game links for the specified division and gender
     """
-    game_links = []
+    index = mapping.get('by_combo')
+    if index is None:
+        # Mappings written before the index existed: build it once and keep it on the dict
+        index = _build_combo_index(mapping.get('game_links', {}))
+        mapping['by_combo'] = index
     
-    for game_link, info in mapping.get('game_links', {}).items():
-        # Check if this division/gender combination should scrape this game
-        for combo in info.get('all_combinations', []):
-            if combo['division'] == division and combo['gender'] == gender:
-                game_links.append(game_link)
-                break
+    return list(index.get(_combo_key(division, gender), []))
+
+
+def _combo_key(division: str, gender: str) -> str:
+    """Key used for a division/gender pair in the combo index."""
+    return f"{division}_{gender}"
+
+
+def _build_combo_index(game_links: Dict) -> Dict[str, List[str]]:
+    """
+    Invert the game links mapping into division/gender -> game links.
     
-    return game_links
+    Args:
+        game_links: The 'game_links' section of a mapping
+        
+    Returns:
+        Dictionary keyed by "{division}_{gender}" with game links in mapping order
+    """
+    index: Dict[str, List[str]] = defaultdict(list)
+    for game_link, info in game_links.items():
+        for combo in info.get('all_combinations', []):
+            key = _combo_key(combo['division'], combo['gender'])
+            # A game only appears once per combination
+            if not index[key] or index[key][-1] != game_link:
+                index[key].append(game_link)
+    return dict(index)
 
 
 def is_duplicate_game(mapping: Dict, game_link: str, division: str) -> bool:
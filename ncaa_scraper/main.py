@@ -3,16 +3,16 @@
 import argparse
 import logging
 from datetime import date
-from typing import List
+from typing import Dict, List, Optional, Set
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from .config import get_config, Division, Gender
-from .scrapers import NCAAScraper
+from .scrapers import NCAAScraper, WebDriverPool
 from .scrapers.selenium_utils import SeleniumUtils
-from .utils import get_yesterday, format_date_for_url, generate_ncaa_urls
+from .utils import get_yesterday, format_date_for_url, generate_ncaa_urls, generate_ncaa_urls_for_dates
 from .models import ScrapingConfig, DateRange
-from .config.constants import ErrorType
+from .config.constants import ErrorType, GDRIVE_MAX_WORKERS, GAME_LINK_TEMPLATE
 from .discovery import discover_games, load_game_links_mapping, get_games_for_division_gender
-import time
 import json
 
 logger = logging.getLogger(__name__)
@@ -28,6 +28,7 @@ def main():
     parser.add_argument('--no-upload-gdrive', action='store_true', help='Disable Google Drive upload')
     parser.add_argument('--gdrive-folder-id', type=str, help='Google Drive folder ID to upload to (optional)')
     parser.add_argument('--force-rescrape', action='store_true', help='Force rescrape and override existing Google Drive files')
+    parser.add_argument('--no-cache', action='store_true', help='Fetch every game page instead of reusing games cached by earlier runs')
     parser.add_argument('--divisions', nargs='+', choices=['d1', 'd2', 'd3'], default=['d1', 'd2', 'd3'], 
                        help='Divisions to scrape (default: all divisions)')
     parser.add_argument('--genders', nargs='+', choices=['men', 'women'], default=['men', 'women'], 
@@ -67,6 +68,12 @@ def main():
     os.makedirs(config.output_dir, exist_ok=True)
     logger.info(f"Output directory: {os.path.abspath(config.output_dir)}")
     
+    # One scraper (and its storage/Drive/notification clients) for the whole invocation
+    scraper = NCAAScraper(config)
+    scraper.use_cache = not args.no_cache
+    if config.metrics_port:
+        scraper.phase_timer.start_server(config.metrics_port)
+    
     # Handle test game mode
     if args.test_game:
         logger.info(f"Test game mode: testing {args.test_game}")
@@ -76,7 +83,7 @@ def main():
             if not game_link.startswith('http'):
                 # It's just a contest ID, construct the URL
                 contest_id = game_link
-                game_link = f"https://stats.ncaa.org/contests/{contest_id}/individual_stats"
+                game_link = GAME_LINK_TEMPLATE.format(contest_id)
                 logger.info(f"Constructed game URL from contest ID: {game_link}")
             
             # Get date, division, and gender
@@ -94,8 +101,6 @@ def main():
             division = args.test_game_division
             gender = args.test_game_gender
             
-            # Initialize scraper
-            scraper = NCAAScraper(config)
             scraper.force_rescrape = True  # Always force for testing
             
             # Create CSV path for test output
@@ -116,7 +121,10 @@ def main():
                     game_link, year, month, day, gender, division, csv_path
                 )
                 
-                if game_data:
+                if game_data and not scraper.csv_handler.flush_pending(csv_path):
+                    logger.error(f"✗ Game was scraped but could not be written to: {csv_path}")
+                    return 1
+                elif game_data:
                     logger.info("✓ Game is scrapeable!")
                     logger.info(f"  Game ID: {game_data.game_id}")
                     logger.info(f"  Teams: {game_data.team_one.team_name} vs {game_data.team_two.team_name}")
@@ -142,7 +150,7 @@ def main():
         target_date = _parse_date(args.date) if args.date else get_yesterday()
         logger.info(f"Discovery mode: extracting game links for {target_date}")
         try:
-            mapping = discover_games(target_date, "discovery/game_links_mapping.json")
+            mapping = discover_games(target_date, "discovery/game_links_mapping.json", scraper=scraper)
             logger.info(f"Discovery completed successfully. Found {mapping['total_games']} games.")
             return 0
         except Exception as e:
@@ -163,8 +171,6 @@ def main():
             game_links = get_games_for_division_gender(mapping, args.single_division, args.single_gender)
             logger.info(f"Found {len(game_links)} games to scrape for {args.single_division} {args.single_gender}")
             
-            # Initialize scraper
-            scraper = NCAAScraper(config)
             scraper.force_rescrape = args.force_rescrape
             
             # Set duplicate mapping on scraper
@@ -189,9 +195,6 @@ def main():
             logger.error(f"Error in single division/gender scraping: {e}")
             return 1
     
-    # Initialize scraper
-    scraper = NCAAScraper(config)
-    
     try:
         if args.backfill:
             # Backfill specific dates
@@ -232,9 +235,9 @@ def main():
 
 def _parse_date(date_str: str) -> date:
     """Parse date string to date object."""
-    from datetime import datetime
     try:
-        return datetime.strptime(date_str, '%Y/%m/%d').date()
+        year, month, day = date_str.split('/')
+        return date(int(year), int(month), int(day))
     except ValueError:
         logger.error(f"Invalid date format: {date_str}. Expected YYYY/MM/DD")
         raise
@@ -246,57 +249,37 @@ def _run_scraping_session(scraper: NCAAScraper, scraping_config: ScrapingConfig)
     scraper.force_rescrape = scraping_config.force_rescrape
     
     # Generate URLs for all dates in range
-    all_urls = []
-    current_date = scraping_config.date_range.start_date
-    end_date = scraping_config.date_range.end_date or scraping_config.date_range.start_date
+    start_date = scraping_config.date_range.start_date
+    end_date = scraping_config.date_range.end_date or start_date
     
     from datetime import timedelta
     
-    while current_date <= end_date:
-        date_str = format_date_for_url(current_date)
-        urls = generate_ncaa_urls(date_str, scraping_config.divisions, scraping_config.genders)
-        all_urls.extend(urls)
-        current_date += timedelta(days=1)
+    dates = [start_date + timedelta(days=offset) for offset in range((end_date - start_date).days + 1)]
+    all_urls = generate_ncaa_urls_for_dates(dates, scraping_config.divisions, scraping_config.genders)
     
     # Pre-check Google Drive for existing files (if enabled and not forcing rescrape)
     if scraping_config.upload_to_gdrive and not scraping_config.force_rescrape:
         logger.info("Pre-checking Google Drive for existing files...")
-        _precheck_google_drive(scraper, all_urls)
+        missing_urls = _precheck_google_drive(scraper, all_urls)
+        if missing_urls is not None:
+            all_urls = missing_urls
     elif scraping_config.force_rescrape:
         logger.info("Force rescrape enabled - will override existing Google Drive files")
     
-    # Scrape each URL with progress logging and cleanup between URLs
+    # Scrape every URL with one shared driver pool
     total_urls = len(all_urls)
     logger.info(f"Starting scraping session: {total_urls} URLs to process")
     
-    for idx, url in enumerate(all_urls, 1):
-        try:
-            logger.info(f"Processing URL {idx}/{total_urls}: {url}")
-            scraper.scrape(url)
-            
-            # Cleanup driver between URLs to prevent resource buildup
-            if scraper.driver:
-                try:
-                    SeleniumUtils.safe_quit_driver(scraper.driver)
-                    scraper.driver = None
-                    SeleniumUtils._cleanup_driver_resources()
-                    time.sleep(2)  # Brief pause between URLs for resource cleanup
-                except Exception as cleanup_error:
-                    logger.warning(f"Error during driver cleanup between URLs: {cleanup_error}")
-                    
-        except Exception as e:
-            logger.error(f"Error processing URL {url}: {e}")
-            # Ensure driver is cleaned up even on error
-            if scraper.driver:
-                try:
-                    SeleniumUtils.safe_quit_driver(scraper.driver)
-                    scraper.driver = None
-                    SeleniumUtils._cleanup_driver_resources()
-                except Exception:
-                    pass
-            continue
+    try:
+        scraper.scrape_many(all_urls)
+    finally:
+        SeleniumUtils._cleanup_driver_resources()
+    
+    # Uploads run in the background while later URLs are scraped
+    scraper.wait_for_uploads()
     
     logger.info(f"Completed scraping session: {total_urls} URLs processed")
+    scraper.phase_timer.log_summary()
 
 
 def _scrape_games_from_mapping(
@@ -320,125 +303,204 @@ def _scrape_games_from_mapping(
     
     logger.info(f"Scraping {len(game_links)} games for {division} {gender}")
     
-    # Initialize driver
-    try:
-        scraper.driver = SeleniumUtils.create_driver(headless=True, max_retries=3)
-    except Exception as e:
-        logger.error(f"Failed to initialize WebDriver: {e}")
-        return
+    mapping = getattr(scraper, 'duplicate_mapping', {})
+    total = len(game_links)
+    
+    # Read each primary division's CSV once up front instead of once per duplicate game
+    primary_divisions = set()
+    for game_link in game_links:
+        game_info = mapping.get('game_links', {}).get(game_link, {})
+        primary_division = game_info.get('primary_division', division)
+        if game_info.get('is_duplicate', False) and primary_division != division:
+            primary_divisions.add(primary_division)
+    
+    primary_csv_paths = [
+        scraper.file_manager.get_csv_path(year, month, day, gender, primary_division)
+        for primary_division in primary_divisions
+    ]
+    
+    # Read this division's existing game IDs once instead of re-reading the CSV per game,
+    # alongside the primary CSVs (the reads are I/O-bound and touch different files)
+    primary_rows: Dict = {}
+    with ThreadPoolExecutor(max_workers=len(primary_csv_paths) + 1) as readers:
+        ids_future = readers.submit(scraper.csv_handler.get_existing_game_ids, csv_path)
+        for rows in readers.map(scraper.csv_handler.get_games_by_link, primary_csv_paths):
+            primary_rows.update(rows)
+        existing_ids = ids_future.result()
+    
+    def worker(idx: int, game_link: str) -> bool:
+        # A driver is only borrowed from the pool if the game can't be read over plain HTTP
+        with scraper.using_pool(pool):
+            logger.info("Scraping game %d/%d: %s", idx, total, game_link)
+            return _scrape_mapped_game(
+                scraper, game_link, mapping, year, month, day, gender, division, csv_path,
+                primary_rows, existing_ids
+            )
     
     try:
         scraped_count = 0
-        for idx, game_link in enumerate(game_links, 1):
-            try:
-                logger.info(f"Scraping game {idx}/{len(game_links)}: {game_link}")
-                
-                # Check if duplicate from discovery mapping
-                mapping = getattr(scraper, 'duplicate_mapping', {})
-                game_info = mapping.get('game_links', {}).get(game_link, {})
-                is_duplicate = game_info.get('is_duplicate', False)
-                primary_division = game_info.get('primary_division', division)
-                
-                # If it's a duplicate and we're not the primary division, try to copy first
-                if is_duplicate and primary_division != division:
-                    logger.info(f"Game is duplicate (primary: {primary_division}), attempting to copy from {primary_division} division")
-                    primary_csv_path = scraper.file_manager.get_csv_path(year, month, day, gender, primary_division)
-                    
-                    # Try to read from primary CSV
-                    existing_data = scraper.csv_handler.get_game_data_by_link(primary_csv_path, game_link)
-                    if existing_data is not None and not existing_data.empty:
-                        # Mark as duplicate and copy
-                        existing_data = existing_data.copy()
-                        if 'DUPLICATE_ACROSS_DIVISIONS' not in existing_data.columns:
-                            existing_data['DUPLICATE_ACROSS_DIVISIONS'] = True
-                        else:
-                            existing_data['DUPLICATE_ACROSS_DIVISIONS'] = True
-                        
-                        # Append to current division's CSV
-                        if scraper.csv_handler.append_game_data(csv_path, existing_data):
-                            logger.info(f"Copied duplicate game data from {primary_division}")
-                            scraped_count += 1
-                            continue
-                        else:
-                            logger.warning(f"Failed to copy, will scrape instead")
-                    else:
-                        logger.info(f"Primary CSV doesn't exist yet, will scrape and mark as duplicate")
-                
-                # Scrape the game (will be marked as duplicate if is_duplicate and not primary division)
-                # Pass the duplicate status to the scraper
-                game_data = scraper._scrape_single_game(
-                    game_link, year, month, day, gender, division, csv_path,
-                    is_duplicate_from_mapping=is_duplicate and primary_division != division
-                )
-                
-                if game_data:
-                    scraped_count += 1
-                
-                # Recreate driver every 20 games
-                if idx > 0 and idx % 20 == 0:
-                    logger.info(f"Recreating driver after {idx} games...")
+        max_workers = max(1, min(scraper.config.max_workers, total))
+        with WebDriverPool(size=max_workers) as pool:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(worker, idx, game_link): game_link
+                    for idx, game_link in enumerate(game_links, 1)
+                }
+                for future in as_completed(futures):
                     try:
-                        SeleniumUtils._cleanup_driver_resources()
-                        SeleniumUtils.safe_quit_driver(scraper.driver)
-                        scraper.driver = None
-                        time.sleep(3)
-                        scraper.driver = SeleniumUtils.create_driver(headless=True, max_retries=3)
+                        if future.result():
+                            scraped_count += 1
                     except Exception as e:
-                        logger.warning(f"Error recreating driver: {e}")
-                
-            except Exception as e:
-                logger.error(f"Error scraping game {game_link}: {e}")
-                continue
+                        logger.error("Error scraping game %s: %s", futures[future], e)
         
         logger.info(f"Scraped {scraped_count}/{len(game_links)} games successfully")
+        scraper.phase_timer.log_summary()
+        flushed = scraper.csv_handler.flush_pending(csv_path)
         
         # Upload to Google Drive if enabled
-        if scraper.config.upload_to_gdrive and scraper.file_manager.file_exists_and_has_content(csv_path):
+        if not flushed:
+            logger.error(f"Not uploading {csv_path}: some game data could not be written")
+        elif scraper.config.upload_to_gdrive and scraper.file_manager.file_exists_and_has_content(csv_path):
             logger.info(f"Uploading CSV to Google Drive: {csv_path}")
             scraper.upload_to_gdrive(csv_path, year, month, gender, division)
             
     finally:
-        if scraper.driver:
-            SeleniumUtils.safe_quit_driver(scraper.driver)
-            scraper.driver = None
-            SeleniumUtils._cleanup_driver_resources()
+        scraper.csv_handler.flush_pending(csv_path)
+        scraper.quit_all_drivers()
+        SeleniumUtils._cleanup_driver_resources()
+
+
+def _scrape_mapped_game(
+    scraper: NCAAScraper,
+    game_link: str,
+    mapping: Dict,
+    year: str,
+    month: str,
+    day: str,
+    gender: str,
+    division: str,
+    csv_path: str,
+    primary_rows: Optional[Dict] = None,
+    existing_ids: Optional[Set[str]] = None
+) -> bool:
+    """
+    Scrape (or copy from the primary division) one game listed in the discovery mapping.
+    
+    Args:
+        scraper: Scraper whose driver for the calling thread is used
+        game_link: Game link to scrape
+        mapping: Discovery mapping with duplicate information
+        year: Year
+        month: Month
+        day: Day
+        gender: Gender (men, women)
+        division: Division being scraped (d1, d2, d3)
+        csv_path: CSV file for this division
+        primary_rows: Preloaded primary-division rows keyed by game link
+        existing_ids: Game IDs already in csv_path
+    
+    Returns:
+        True if the game was scraped or copied, False otherwise
+    """
+    # Check if duplicate from discovery mapping
+    game_info = mapping.get('game_links', {}).get(game_link, {})
+    is_duplicate = game_info.get('is_duplicate', False)
+    primary_division = game_info.get('primary_division', division)
+    
+    # If it's a duplicate and we're not the primary division, try to copy first
+    if is_duplicate and primary_division != division:
+        logger.info("Game is duplicate (primary: %s), attempting to copy from %s division", primary_division, primary_division)
+        primary_csv_path = scraper.file_manager.get_csv_path(year, month, day, gender, primary_division)
+        
+        # Use the preloaded primary rows; re-read the CSV only if the game wasn't there yet
+        existing_data = (primary_rows or {}).get(game_link)
+        if existing_data is None:
+            existing_data = scraper.csv_handler.get_game_data_by_link(primary_csv_path, game_link)
+        if existing_data is not None and not existing_data.empty:
+            # Mark as duplicate (assign only builds the new column)
+            existing_data = existing_data.assign(DUPLICATE_ACROSS_DIVISIONS=True)
+            
+            # Append to current division's CSV
+            if scraper.csv_handler.append_game_data(csv_path, existing_data):
+                logger.info("Copied duplicate game data from %s", primary_division)
+                return True
+            else:
+                logger.warning("Failed to copy, will scrape instead")
+        else:
+            logger.info("Primary CSV doesn't exist yet, will scrape and mark as duplicate")
+    
+    # Scrape the game (will be marked as duplicate if is_duplicate and not primary division)
+    # Pass the duplicate status to the scraper
+    game_data = scraper._scrape_single_game(
+        game_link, year, month, day, gender, division, csv_path,
+        is_duplicate_from_mapping=is_duplicate and primary_division != division,
+        existing_ids=existing_ids
+    )
+    
+    return bool(game_data)
 
 
-def _precheck_google_drive(scraper: NCAAScraper, urls: List[str]):
-    """Pre-check Google Drive for existing files to provide summary."""
+def _precheck_google_drive(scraper: NCAAScraper, urls: List[str]) -> Optional[List[str]]:
+    """
+    Pre-check Google Drive for existing files so only missing dates are scraped.
+    
+    Args:
+        scraper: Scraper whose Google Drive manager is used
+        urls: Scoreboard URLs to check
+    
+    Returns:
+        URLs whose files are not yet in Google Drive (in their original order),
+        or None if the pre-check could not run
+    """
     try:
         from .utils import parse_url_components
         
-        existing_count = 0
-        total_count = len(urls)
+        if not scraper.google_drive.service and not scraper.google_drive.authenticate():
+            logger.warning("Could not authenticate with Google Drive, skipping pre-check")
+            return None
         
+        url_keys: Dict[str, tuple] = {}
         for url in urls:
-            try:
-                components = parse_url_components(url)
-                year = components['year']
-                month = components['month']
-                day = components['day']
-                gender = components['gender']
-                division = components['division']
-                
-                gdrive_exists, _ = scraper.google_drive.check_file_exists_in_gdrive(
-                    year, month, gender, division, day
-                )
-                
-                if gdrive_exists:
-                    existing_count += 1
-                    logger.info(f"✓ {gender} {division} {year}-{month}-{day} already exists in Google Drive")
-                else:
-                    logger.info(f"✗ {gender} {division} {year}-{month}-{day} needs scraping")
-                    
-            except Exception as e:
-                logger.warning(f"Error checking Google Drive for {url}: {e}")
-                continue
+            components = parse_url_components(url)
+            url_keys[url] = (
+                components.year, components.month, components.day,
+                components.gender, components.division
+            )
+        
+        # One bulk listing per month instead of one lookup per URL
+        months = sorted({(key[0], key[1]) for key in url_keys.values()})
+        existing: set = set()
+        max_workers = max(1, min(GDRIVE_MAX_WORKERS, len(months)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(scraper.google_drive.list_existing_files, year, month): (year, month)
+                for year, month in months
+            }
+            for future in as_completed(futures):
+                year, month = futures[future]
+                month_files = future.result()
+                if month_files is None:
+                    logger.warning(f"Could not list Google Drive files for {year}-{month}, treating as missing")
+                    continue
+                existing |= month_files
+        
+        exists: Dict[str, bool] = {}
+        for url, key in url_keys.items():
+            year, month, day, gender, division = key
+            exists[url] = key in existing
+            if exists[url]:
+                logger.info(f"✓ {gender} {division} {year}-{month}-{day} already exists in Google Drive")
+            else:
+                logger.info(f"✗ {gender} {division} {year}-{month}-{day} needs scraping")
         
-        logger.info(f"Google Drive pre-check complete: {existing_count}/{total_count} files already exist")
+        missing_urls = [url for url in urls if not exists.get(url, False)]
+        existing_count = len(urls) - len(missing_urls)
+        logger.info(f"Google Drive pre-check complete: {existing_count}/{len(urls)} files already exist")
+        return missing_urls
         
     except Exception as e:
         logger.error(f"Error during Google Drive pre-check: {e}")
+        return None
 
 
 if __name__ == "__main__":
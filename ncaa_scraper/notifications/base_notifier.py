@@ -1,7 +1,7 @@
 """Base notification interface for the NCAA scraper."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import logging
 
 from ..config.constants import ErrorType
@@ -43,6 +43,21 @@ class BaseNotifier(ABC):
         """
         pass
     
+    def send_notifications(self, notifications: List[Dict[str, Any]]) -> bool:
+        """
+        Send several notifications.
+        
+        Notifiers that can deliver many messages in one request should override this.
+        
+        Args:
+            notifications: send_notification keyword arguments, one dict per notification
+        
+        Returns:
+            True if every notification was sent successfully, False otherwise
+        """
+        results = [self.send_notification(**notification) for notification in notifications]
+        return all(results)
+    
     def is_enabled(self) -> bool:
         """Check if notifier is enabled."""
         return self.enabled
@@ -3,10 +3,11 @@
 import requests
 import datetime
 import logging
-from typing import Optional, Dict, Any
+from collections import defaultdict
+from typing import Optional, Dict, Any, List
 
 from .base_notifier import BaseNotifier
-from ..config.constants import ErrorType
+from ..config.constants import ErrorType, DISCORD_MAX_EMBEDS, DISCORD_MAX_MESSAGE_CHARS, DISCORD_MAX_DESCRIPTION
 
 logger = logging.getLogger(__name__)
 
@@ -49,73 +50,8 @@ class DiscordNotifier(BaseNotifier):
             return False
         
         try:
-            # Choose emoji based on error type
-            emoji_map = {
-                ErrorType.ERROR: "🚨",
-                ErrorType.WARNING: "⚠️",
-                ErrorType.INFO: "ℹ️",
-                ErrorType.SUCCESS: "✅",
-                ErrorType.GAME_ERROR: "🏀"
-            }
-            emoji = emoji_map.get(error_type, "📢")
-            
-            # Build title with context
-            title = f"{emoji} NCAA Scraper {error_type.value}"
-            if division and gender:
-                title += f" - {gender.title()} {division.upper()}"
-            
-            # Build description with context
-            description = message
-            fields = []
-            
-            if date:
-                fields.append({
-                    "name": "📅 Date",
-                    "value": date,
-                    "inline": True
-                })
-            
-            if division:
-                fields.append({
-                    "name": "🏆 Division",
-                    "value": division.upper(),
-                    "inline": True
-                })
-            
-            if gender:
-                fields.append({
-                    "name": "⚽ Gender",
-                    "value": gender.title(),
-                    "inline": True
-                })
-            
-            if game_link:
-                fields.append({
-                    "name": "🔗 Game Link",
-                    "value": f"[View Game]({game_link})",
-                    "inline": False
-                })
-            
-            # Create Discord embed
-            embed = {
-                "title": title,
-                "description": description,
-                "color": self._get_color_for_error_type(error_type),
-                "timestamp": datetime.datetime.utcnow().isoformat(),
-                "footer": {
-                    "text": "NCAA Basketball Scraper"
-                }
-            }
-            
-            if fields:
-                embed["fields"] = fields
-            
-            payload = {
-                "embeds": [embed]
-            }
-            
-            response = requests.post(self.webhook_url, json=payload, timeout=10)
-            response.raise_for_status()
+            embed = self._build_embed(message, error_type, division, date, gender, game_link)
+            self._post_embeds([embed])
             logger.debug(f"Discord notification sent successfully: {error_type.value}")
             return True
             
@@ -123,6 +59,151 @@ class DiscordNotifier(BaseNotifier):
             logger.error(f"Failed to send Discord notification: {e}")
             return False
     
+    def send_notifications(self, notifications: List[Dict[str, Any]]) -> bool:
+        """
+        Send several notifications to the Discord webhook, grouped by type.
+        
+        Each group goes out in messages of up to DISCORD_MAX_EMBEDS embeds and
+        DISCORD_MAX_MESSAGE_CHARS characters instead of one webhook request per
+        notification. If a message is rejected its embeds are sent one at a time.
+        
+        Args:
+            notifications: send_notification keyword arguments, one dict per notification
+        
+        Returns:
+            True if every message was sent successfully, False otherwise
+        """
+        if not notifications:
+            return True
+        
+        if not self.enabled or not self.webhook_url:
+            logger.debug("Discord webhook not configured or disabled, skipping notifications")
+            return False
+        
+        groups: Dict[ErrorType, List[Dict[str, Any]]] = defaultdict(list)
+        for notification in notifications:
+            groups[notification['error_type']].append(self._build_embed(**notification))
+        
+        success = True
+        for error_type, embeds in groups.items():
+            for chunk in self._chunk_embeds(embeds):
+                try:
+                    self._post_embeds(chunk)
+                except Exception as e:
+                    logger.warning(f"Failed to send {len(chunk)} Discord notifications together, sending them one at a time: {e}")
+                    for embed in chunk:
+                        try:
+                            self._post_embeds([embed])
+                        except Exception as e:
+                            logger.error(f"Failed to send Discord notification: {e}")
+                            success = False
+            logger.debug(f"Sent {len(embeds)} Discord notifications: {error_type.value}")
+        return success
+    
+    def _build_embed(
+        self,
+        message: str,
+        error_type: ErrorType,
+        division: Optional[str] = None,
+        date: Optional[str] = None,
+        gender: Optional[str] = None,
+        game_link: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Build the Discord embed for one notification."""
+        # Choose emoji based on error type
+        emoji_map = {
+            ErrorType.ERROR: "🚨",
+            ErrorType.WARNING: "⚠️",
+            ErrorType.INFO: "ℹ️",
+            ErrorType.SUCCESS: "✅",
+            ErrorType.GAME_ERROR: "🏀"
+        }
+        emoji = emoji_map.get(error_type, "📢")
+        
+        # Build title with context
+        title = f"{emoji} NCAA Scraper {error_type.value}"
+        if division and gender:
+            title += f" - {gender.title()} {division.upper()}"
+        
+        # Build description with context
+        description = message
+        if len(description) > DISCORD_MAX_DESCRIPTION:
+            # Exception text (e.g. Selenium stack traces) can exceed Discord's limit
+            description = description[:DISCORD_MAX_DESCRIPTION - 1] + "…"
+        fields = []
+        
+        if date:
+            fields.append({
+                "name": "📅 Date",
+                "value": date,
+                "inline": True
+            })
+        
+        if division:
+            fields.append({
+                "name": "🏆 Division",
+                "value": division.upper(),
+                "inline": True
+            })
+        
+        if gender:
+            fields.append({
+                "name": "⚽ Gender",
+                "value": gender.title(),
+                "inline": True
+            })
+        
+        if game_link:
+            fields.append({
+                "name": "🔗 Game Link",
+                "value": f"[View Game]({game_link})",
+                "inline": False
+            })
+        
+        # Create Discord embed
+        embed = {
+            "title": title,
+            "description": description,
+            "color": self._get_color_for_error_type(error_type),
+            "timestamp": datetime.datetime.utcnow().isoformat(),
+            "footer": {
+                "text": "NCAA Basketball Scraper"
+            }
+        }
+        
+        if fields:
+            embed["fields"] = fields
+        
+        return embed
+    
+    @staticmethod
+    def _embed_size(embed: Dict[str, Any]) -> int:
+        """Characters of an embed that count towards Discord's per-message limit."""
+        size = len(embed.get("title", "")) + len(embed.get("description", ""))
+        size += len(embed.get("footer", {}).get("text", ""))
+        for field in embed.get("fields", []):
+            size += len(field["name"]) + len(field["value"])
+        return size
+    
+    def _chunk_embeds(self, embeds: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Split embeds into messages within Discord's embed count and total size limits."""
+        chunks: List[List[Dict[str, Any]]] = []
+        chunk_size = 0
+        for embed in embeds:
+            size = self._embed_size(embed)
+            if not chunks or len(chunks[-1]) >= DISCORD_MAX_EMBEDS or chunk_size + size > DISCORD_MAX_MESSAGE_CHARS:
+                chunks.append([])
+                chunk_size = 0
+            chunks[-1].append(embed)
+            chunk_size += size
+        return chunks
+    
+    def _post_embeds(self, embeds: List[Dict[str, Any]]):
+        """Post embeds to the webhook in one message, raising on failure."""
+        response = requests.post(self.webhook_url, json={"embeds": embeds}, timeout=10)
+        response.raise_for_status()
+    
     def _get_color_for_error_type(self, error_type: ErrorType) -> int:
         """Get Discord embed color based on error type."""
         color_map = {
@@ -1,14 +1,17 @@
 """Base scraper class for the NCAA scraper."""
 
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from typing import List, Dict, Any, Set, Optional
 import logging
+import threading
 
 from ..config import ScraperConfig
 from ..models import GameData
 from ..storage import FileManager, CSVHandler, GoogleDriveManager
 from ..notifications import DiscordNotifier
-from ..config.constants import ErrorType
+from ..config.constants import ErrorType, GDRIVE_BACKGROUND_WORKERS
 
 logger = logging.getLogger(__name__)
 
@@ -23,9 +26,19 @@ class BaseScraper(ABC):
         
         # Initialize components
         self.file_manager = FileManager(config.output_dir)
-        self.csv_handler = CSVHandler(self.file_manager)
+        self.csv_handler = CSVHandler(self.file_manager, engine=config.csv_engine)
         self.google_drive = GoogleDriveManager(config)
         self.notifier = DiscordNotifier(config.discord_webhook_url)
+        
+        # Google Drive calls run in the background so they overlap with scraping
+        self._gdrive_pool = ThreadPoolExecutor(max_workers=GDRIVE_BACKGROUND_WORKERS)
+        self._upload_futures: List[Future] = []
+        # Latest queued upload per file, so repeat requests for a file still waiting are coalesced
+        self._queued_uploads: Dict[str, Future] = {}
+        
+        # Notifications raised inside collecting_notifications() are sent together at the end
+        self._notification_batch: Optional[List[Dict[str, Any]]] = None
+        self._notification_lock = threading.Lock()
     
     @abstractmethod
     def scrape(self, url: str) -> List[GameData]:
@@ -57,6 +70,9 @@ class BaseScraper(ABC):
         """
         Save game data to CSV file.
         
+        Rows are buffered and appended in batches; call csv_handler.flush_pending
+        before relying on the file's contents.
+        
         Args:
             game_data: Game data to save
             csv_path: Path to CSV file
@@ -66,7 +82,7 @@ class BaseScraper(ABC):
         """
         try:
             combined_df = game_data.to_combined_dataframe()
-            return self.csv_handler.append_game_data(csv_path, combined_df)
+            return self.csv_handler.buffer_game_data(csv_path, combined_df)
         except Exception as e:
             self.logger.error(f"Error saving game data: {e}")
             return False
@@ -81,7 +97,7 @@ class BaseScraper(ABC):
         game_link: Optional[str] = None
     ) -> bool:
         """
-        Send a notification.
+        Send a notification, or queue it while collecting_notifications() is active.
         
         Args:
             message: Message to send
@@ -92,12 +108,46 @@ class BaseScraper(ABC):
             game_link: Specific game link if applicable
         
         Returns:
-            True if notification sent successfully, False otherwise
+            True if notification sent (or queued) successfully, False otherwise
         """
+        with self._notification_lock:
+            if self._notification_batch is not None:
+                self._notification_batch.append({
+                    'message': message,
+                    'error_type': error_type,
+                    'division': division,
+                    'date': date,
+                    'gender': gender,
+                    'game_link': game_link
+                })
+                return True
+        
         return self.notifier.send_notification(
             message, error_type, division, date, gender, game_link
         )
     
+    @contextmanager
+    def collecting_notifications(self):
+        """
+        Queue notifications sent inside the block and send them in one batch when it exits.
+        
+        Keeps webhook requests off the scraping path and collapses a bad day's
+        failures into a few messages.
+        """
+        with self._notification_lock:
+            outer = self._notification_batch is not None
+            if not outer:
+                self._notification_batch = []
+        
+        try:
+            yield
+        finally:
+            if not outer:
+                with self._notification_lock:
+                    batch, self._notification_batch = self._notification_batch, None
+                if batch:
+                    self.notifier.send_notifications(batch)
+    
     def upload_to_gdrive(self, file_path: str, year: str, month: str, gender: str, division: str) -> bool:
         """
         Upload file to Google Drive with intelligent duplicate detection.
@@ -160,3 +210,50 @@ class BaseScraper(ABC):
         except Exception as e:
             self.logger.error(f"Error uploading to Google Drive: {e}")
             return False
+    
+    def upload_to_gdrive_async(self, file_path: str, year: str, month: str, gender: str, division: str) -> Future:
+        """
+        Queue an upload_to_gdrive call on the background Google Drive pool.
+        
+        The file is read when the upload runs, so queuing it again after the
+        file changes always ends with the latest contents in Google Drive. If an
+        upload of the same file is still waiting to start, that one is reused.
+        
+        Args:
+            file_path: Path to file to upload
+            year: Year
+            month: Month
+            gender: Gender
+            division: Division
+        
+        Returns:
+            Future resolving to the upload_to_gdrive result
+        """
+        queued = self._queued_uploads.get(file_path)
+        if queued is not None and not queued.running() and not queued.done():
+            return queued
+        
+        future = self._gdrive_pool.submit(self.upload_to_gdrive, file_path, year, month, gender, division)
+        self._upload_futures.append(future)
+        self._queued_uploads[file_path] = future
+        return future
+    
+    def wait_for_uploads(self) -> bool:
+        """
+        Block until every queued Google Drive upload has finished.
+        
+        Returns:
+            True if all uploads succeeded, False otherwise
+        """
+        futures, self._upload_futures = self._upload_futures, []
+        self._queued_uploads = {}
+        if not futures:
+            return True
+        
+        self.logger.info(f"Waiting for {len(futures)} Google Drive uploads to finish...")
+        wait(futures)
+        failed = sum(1 for future in futures if future.exception() or not future.result())
+        if failed:
+            self.logger.error(f"{failed}/{len(futures)} Google Drive uploads failed")
+        return failed == 0
+
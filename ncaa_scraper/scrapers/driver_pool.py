@@ -0,0 +1,226 @@
+"""Pool of reusable Chrome WebDrivers for the NCAA scraper."""
+
+import logging
+import queue
+import threading
+from typing import Dict, Optional
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+from .selenium_utils import SeleniumUtils
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+# Seconds a pooled driver has to answer a trivial script before it is replaced
+HEALTH_PROBE_TIMEOUT = 2
+
+
+class WebDriverPool:
+    """
+    Bounded pool of Chrome drivers shared by scraping workers.
+    
+    Drivers are created on demand up to ``size`` and handed back with
+    ``release`` after each page. A driver is only rebuilt when it has served
+    ``max_uses`` pages, its browser's memory exceeds ``max_rss_mb`` (after an
+    in-place purge), or its session has died or stopped responding, instead of
+    tearing every driver down on a fixed schedule.
+    """
+    
+    def __init__(self, size: int, max_uses: int = 100, max_rss_mb: int = 1024, headless: bool = True):
+        self.size = max(1, size)
+        self.max_uses = max_uses
+        self.max_rss_mb = max_rss_mb
+        self.headless = headless
+        
+        self._idle: "queue.Queue[webdriver.Chrome]" = queue.Queue()
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._uses: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+    
+    def __enter__(self) -> 'WebDriverPool':
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def acquire(self, timeout: Optional[float] = None) -> webdriver.Chrome:
+        """
+        Take a driver from the pool, creating one if none is idle.
+        
+        Args:
+            timeout: Maximum time to wait for a free slot (None waits forever)
+        
+        Returns:
+            Chrome WebDriver reserved for the caller until release()
+        
+        Raises:
+            TimeoutError: If no slot became free within the timeout
+        """
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError("Timed out waiting for a WebDriver from the pool")
+        
+        try:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                return self._create()
+        except Exception:
+            self._slots.release()
+            raise
+    
+    def release(self, driver: Optional[webdriver.Chrome]):
+        """
+        Return a driver to the pool, replacing it if it should be recycled.
+        
+        The driver may differ from the one acquired (e.g. if the caller had to
+        recreate a frozen driver); whatever is handed back is what gets pooled.
+        
+        Args:
+            driver: Driver to return (None if the caller lost it)
+        """
+        try:
+            if driver is None or self._closed:
+                self._discard(driver)
+                return
+            
+            with self._lock:
+                self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+            
+            if self.should_recycle(driver):
+                driver = self.replace(driver)
+            
+            if driver is not None:
+                self._idle.put(driver)
+        finally:
+            self._slots.release()
+    
+    def should_recycle(self, driver: webdriver.Chrome) -> bool:
+        """
+        Check whether a driver has worn out.
+        
+        Args:
+            driver: Driver to check
+        
+        Returns:
+            True if the driver hit its use limit, uses too much memory, or is dead
+        """
+        uses = self._uses.get(id(driver), 0)
+        if uses >= self.max_uses:
+            logger.info(f"Recycling driver after {uses} pages")
+            return True
+        
+        rss_mb = self._browser_rss_mb(driver)
+        if rss_mb is not None and rss_mb > self.max_rss_mb:
+            # Purging caches in place is much cheaper than a cold Chrome start
+            if SeleniumUtils.purge_browser_memory(driver):
+                rss_mb = self._browser_rss_mb(driver)
+            if rss_mb is not None and rss_mb > self.max_rss_mb:
+                logger.info(f"Recycling driver using {rss_mb:.0f} MB (limit {self.max_rss_mb} MB)")
+                return True
+        
+        try:
+            # A healthy driver answers at once; a hung one would otherwise block the next page
+            alive = SeleniumUtils.safe_driver_operation(
+                driver, lambda: driver.execute_script("return 1"), timeout=HEALTH_PROBE_TIMEOUT,
+                operation_name="driver health probe"
+            )
+        except WebDriverException as e:
+            logger.warning(f"Recycling driver with lost session: {e}")
+            return True
+        
+        if alive != 1:
+            logger.warning(f"Recycling driver that did not answer within {HEALTH_PROBE_TIMEOUT}s")
+            return True
+        
+        return False
+    
+    def replace(self, driver: webdriver.Chrome) -> Optional[webdriver.Chrome]:
+        """
+        Quit a driver and create a fresh one in its place.
+        
+        Args:
+            driver: Driver to replace
+        
+        Returns:
+            New driver, or None if one could not be created (the next acquire retries)
+        """
+        self._discard(driver)
+        try:
+            return self._create()
+        except Exception as e:
+            logger.error(f"Failed to create replacement driver: {e}")
+            return None
+    
+    def replace_async(self, driver: Optional[webdriver.Chrome]):
+        """
+        Hand back a broken driver and rebuild it on a background thread.
+        
+        The caller's slot stays taken until the replacement is idle, so other
+        workers keep their drivers while Chrome restarts and the pool never
+        grows past ``size``.
+        
+        Args:
+            driver: Driver to replace (None if the caller lost it)
+        """
+        def rebuild():
+            try:
+                new_driver = self.replace(driver)
+                with self._lock:
+                    if new_driver is not None and not self._closed:
+                        self._idle.put(new_driver)
+                        new_driver = None
+                self._discard(new_driver)
+            finally:
+                self._slots.release()
+        
+        threading.Thread(target=rebuild, name="webdriver-rebuild", daemon=True).start()
+    
+    def close(self):
+        """Quit every idle driver and stop pooling drivers that are returned later."""
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                self._discard(self._idle.get_nowait())
+            except queue.Empty:
+                break
+    
+    def _create(self) -> webdriver.Chrome:
+        """Create a new driver and start counting its uses."""
+        driver = SeleniumUtils.create_driver(headless=self.headless, max_retries=3)
+        with self._lock:
+            self._uses[id(driver)] = 0
+        return driver
+    
+    def _discard(self, driver: Optional[webdriver.Chrome]):
+        """Quit a driver and forget its use count."""
+        if driver is None:
+            return
+        with self._lock:
+            self._uses.pop(id(driver), None)
+        SeleniumUtils.safe_quit_driver(driver)
+    
+    @staticmethod
+    def _browser_rss_mb(driver: webdriver.Chrome) -> Optional[float]:
+        """Resident memory of chromedriver and its browser processes, in MB (None if unknown)."""
+        if psutil is None:
+            return None
+        
+        try:
+            process = psutil.Process(driver.service.process.pid)
+            processes = [process] + process.children(recursive=True)
+            total = 0
+            for proc in processes:
+                try:
+                    total += proc.memory_info().rss
+                except psutil.Error:
+                    continue
+            return total / 1024 / 1024
+        except Exception:
+            return None
@@ -1,8 +1,15 @@
 """NCAA-specific scraper implementation."""
 
+import os
 import time
+import random
+import hashlib
 import logging
-from typing import List, Optional, Set, Dict
+import threading
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional, Set, Dict, Tuple
+from dataclasses import replace
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -10,14 +17,70 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
 from io import StringIO
 import pandas as pd
-from bs4 import BeautifulSoup
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
+from lxml import etree
 import re
+from collections import defaultdict
 
 from .base_scraper import BaseScraper
-from .selenium_utils import SeleniumUtils
+from .selenium_utils import SeleniumUtils, WAIT_POLL_FREQUENCY
+from .driver_pool import WebDriverPool
 from ..models import GameData, TeamData
-from ..utils import parse_url_components, extract_game_id_from_url
-from ..config.constants import ErrorType
+from ..storage import GameCache, VisitedLinksStore
+from ..utils import parse_url_components, extract_game_id_from_url, HostRateLimiter, PhaseTimer
+from ..config.constants import ErrorType, HTTP_HEADERS, HTTP_TIMEOUT, HTTP_POOL_SIZE, GAME_CACHE_FILE, VISITED_LINKS_FILE, GAME_LINK_TEMPLATE
+
+BOX_SCORE_HREF_PATTERN = re.compile(r'/contests/\d+/box_score')
+CONTEST_ID_PATTERN = re.compile(r'/contests/(\d+)/')
+
+# A scoreboard is ready to scrape once a game card's table is in the DOM
+SCOREBOARD_READY_LOCATOR = (By.CSS_SELECTOR, 'div.row div.card table')
+SCOREBOARD_CARD_LOCATOR = (By.CSS_SELECTOR, 'div.row div.card')
+NO_GAMES_CLASS = 'no-games-message'
+NO_GAMES_LOCATOR = (By.CLASS_NAME, NO_GAMES_CLASS)
+
+# Any loaded page has a body; used to check a driver is still responsive
+BODY_LOCATOR = (By.TAG_NAME, 'body')
+
+# Per-team individual stats tables on a game page
+STAT_TABLE_LOCATOR = (By.CSS_SELECTOR, "table[id*='competitor_'][id*='_year_stat_category_0_data_table']")
+STAT_TABLE_ID_PATTERN = re.compile(r'competitor_\d+_year_stat_category_0_data_table')
+STAT_TABLE_ID_MARKER = '_year_stat_category_0_data_table'
+PLAYER_ROW_ID_PATTERN = re.compile(r'game_player_\d+_year_stat_category_0')
+# Raw player row cells in page order (the stat table's DREB column is not kept)
+RAW_PLAYER_COLUMNS = [
+    'NO', 'Name', 'PlayerID', 'POS', 'MIN', 'FGM', 'FGA', '3PM', '3PA', 'FTM', 'FTA',
+    'PTS', 'OREB', 'DREB', 'REB', 'AST', 'TO', 'ST', 'BLK', 'PF'
+]
+
+# Precompiled lookups for parsing a game page with lxml
+STAT_TABLES_XPATH = etree.XPath("//table[contains(@id, '_year_stat_category_0_data_table')]")
+CARD_XPATH = etree.XPath("ancestor::div[contains(concat(' ', normalize-space(@class), ' '), ' card ')][1]")
+CARD_HEADER_XPATH = etree.XPath(".//div[contains(concat(' ', normalize-space(@class), ' '), ' card-header ')]")
+PLAYER_ROWS_XPATH = etree.XPath(".//tr[@id]")
+CELLS_XPATH = etree.XPath(".//td")
+
+# Box score hrefs in every game card's table, in one pass (same selection as BOX_SCORE_HREFS_SCRIPT)
+SCOREBOARD_BOX_SCORE_HREFS_XPATH = etree.XPath(
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' row ')]"
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' card ')]"
+    "//table//a[contains(@href, '/box_score')]/@href"
+)
+
+# Box score hrefs of every game card, returned in a single WebDriver round trip
+BOX_SCORE_HREFS_SCRIPT = (
+    "return Array.from(document.querySelectorAll('div.row div.card table a[href*=\"/box_score\"]'))"
+    ".map(a => a.getAttribute('href')).filter(Boolean);"
+)
+
+# Non-empty text of every div under a team selector element
+TEAM_NAMES_SCRIPT = (
+    "return Array.from(arguments[0].querySelectorAll('div'))"
+    ".map(d => d.innerText.trim()).filter(Boolean);"
+)
 
 logger = logging.getLogger(__name__)
 
@@ -27,12 +90,158 @@ class NCAAScraper(BaseScraper):
     
     def __init__(self, config):
         super().__init__(config)
-        self.driver: Optional[webdriver.Chrome] = None
+        # One driver per thread so games can be scraped by several workers at once
+        self._drivers: Dict[int, webdriver.Chrome] = {}
+        self._drivers_lock = threading.Lock()
+        # Browser sessions that have already visited the main page for cookies
+        self._initialized_sessions: Set[str] = set()
+        # Per-thread state that isn't safe to share between workers (HTTP session)
+        self._local = threading.local()
+        # Throttles page loads per host across all game workers
+        self.rate_limiter = HostRateLimiter(config.requests_per_second, burst=config.max_workers)
+        # Time spent per phase of a game scrape, to show where the time goes
+        self.phase_timer = PhaseTimer()
+        # Driver pool shared across scoreboards by scrape_many (None: each scrape makes its own)
+        self._pool: Optional[WebDriverPool] = None
+        # Scoreboard HTTP fetches started ahead of time by scrape_many, by URL
+        self._prefetched: Dict[str, Future] = {}
+        # Parsed games from earlier runs, so re-runs skip pages already fetched
+        self.game_cache = GameCache(os.path.join(config.output_dir, GAME_CACHE_FILE))
+        self.use_cache = True
+        # visited_links from earlier runs, so cross-division duplicates are copied after a restart
+        self.visited_store = VisitedLinksStore(os.path.join(config.output_dir, VISITED_LINKS_FILE))
+        # Parsed teams by stat-table digest, so a page served under several game IDs is parsed once
+        self._parsed_by_digest: Dict[str, Tuple[TeamData, TeamData]] = {}
+        self._digest_lock = threading.Lock()
+    
+    @property
+    def driver(self) -> Optional[webdriver.Chrome]:
+        """WebDriver owned by the calling thread."""
+        return self._drivers.get(threading.get_ident())
+    
+    @driver.setter
+    def driver(self, value: Optional[webdriver.Chrome]):
+        with self._drivers_lock:
+            if value is None:
+                self._drivers.pop(threading.get_ident(), None)
+            else:
+                self._drivers[threading.get_ident()] = value
+    
+    def _ensure_driver(self) -> webdriver.Chrome:
+        """
+        Get the calling thread's driver, borrowing or creating one on first use.
+        
+        Returns:
+            WebDriver owned by the calling thread
+        """
+        if self.driver is None:
+            pool = getattr(self._local, 'pool', None)
+            if pool is not None:
+                self.driver = pool.acquire()
+                self._local.borrowed = True
+            else:
+                self.driver = SeleniumUtils.create_driver(headless=True, max_retries=3)
+        return self.driver
+    
+    @contextmanager
+    def using_pool(self, pool: WebDriverPool):
+        """
+        Let the calling thread borrow a driver from pool only if a page needs Chrome.
+        
+        Whatever driver the thread ends up with is handed back on exit.
+        
+        Args:
+            pool: Pool to borrow from
+        """
+        self._local.pool = pool
+        self._local.borrowed = False
+        try:
+            yield
+        finally:
+            if self._local.borrowed:
+                pool.release(self.driver)
+                self.driver = None
+            self._local.pool = None
+            self._local.borrowed = False
+    
+    def quit_all_drivers(self):
+        """Quit the drivers of every thread that used this scraper."""
+        with self._drivers_lock:
+            drivers = list(self._drivers.values())
+            self._drivers.clear()
+        
+        for driver in drivers:
+            SeleniumUtils.safe_quit_driver(driver)
+    
+    def scrape_many(self, urls: List[str]) -> List[GameData]:
+        """
+        Scrape several scoreboard URLs with one driver pool shared across all of them.
+        
+        Browsers started for one scoreboard keep serving the next, so Chrome
+        startup is paid once per run instead of once per URL, and every
+        scoreboard's HTTP fetch starts up front.
+        
+        Args:
+            urls: NCAA scoreboard URLs
+        
+        Returns:
+            List of scraped game data across all URLs
+        """
+        all_games = []
+        total_urls = len(urls)
+        self._pool = WebDriverPool(size=self.config.max_workers)
+        # Scoreboards are fetched over HTTP concurrently while earlier ones are being scraped
+        prefetcher = ThreadPoolExecutor(max_workers=self.config.max_workers)
+        self._prefetched = {
+            url: prefetcher.submit(self._try_http_extract, url)
+            for url in urls if not self._has_local_data(url)
+        }
+        try:
+            for idx, url in enumerate(urls, 1):
+                self.logger.info(f"Processing URL {idx}/{total_urls}: {url}")
+                all_games.extend(self.scrape(url))
+        finally:
+            for future in self._prefetched.values():
+                future.cancel()
+            self._prefetched = {}
+            prefetcher.shutdown(wait=True)
+            self._pool.close()
+            self._pool = None
+        
+        return all_games
+    
+    def _has_local_data(self, url: str) -> bool:
+        """Check whether scrape(url) will skip the URL because its CSV already exists locally."""
+        if getattr(self, 'force_rescrape', False):
+            return False
+        try:
+            components = parse_url_components(url)
+            csv_path = self.file_manager.get_csv_path(
+                components.year, components.month, components.day, components.gender, components.division
+            )
+            return self.file_manager.file_exists_and_has_content(csv_path)
+        except Exception:
+            return False
     
     def scrape(self, url: str) -> List[GameData]:
         """
         Scrape NCAA box scores from a scoreboard URL.
         
+        Notifications raised while the scoreboard is scraped are sent as one batch at the end.
+        
+        Args:
+            url: NCAA scoreboard URL
+        
+        Returns:
+            List of scraped game data
+        """
+        with self.collecting_notifications():
+            return self._scrape_scoreboard(url)
+    
+    def _scrape_scoreboard(self, url: str) -> List[GameData]:
+        """
+        Scrape NCAA box scores from a scoreboard URL (see scrape).
+        
         Args:
             url: NCAA scoreboard URL
         
@@ -42,11 +251,11 @@ class NCAAScraper(BaseScraper):
         try:
             # Parse URL components
             components = parse_url_components(url)
-            year = components['year']
-            month = components['month']
-            day = components['day']
-            gender = components['gender']
-            division = components['division']
+            year = components.year
+            month = components.month
+            day = components.day
+            gender = components.gender
+            division = components.division
             
             # Create CSV path
             csv_path = self.file_manager.get_csv_path(year, month, day, gender, division)
@@ -57,40 +266,33 @@ class NCAAScraper(BaseScraper):
                 self.logger.info(f"Data for {gender} {division} on {year}-{month}-{day} already exists locally, skipping...")
                 return []
             
-            # Check if data already exists in Google Drive (if enabled)
+            # Check if data already exists in Google Drive (if enabled) in the background,
+            # overlapping the Drive round trip with the scoreboard fetch
             # Skip this check if force_rescrape is enabled
+            gdrive_check = None
             if self.config.upload_to_gdrive and not getattr(self, 'force_rescrape', False):
-                gdrive_exists, gdrive_file_id = self.google_drive.check_file_exists_in_gdrive(
-                    year, month, gender, division, day
+                gdrive_check = self._gdrive_pool.submit(
+                    self.google_drive.check_file_exists_in_gdrive, year, month, gender, division, day
                 )
+            
+            # Read the static scoreboard over HTTP first (prefetched by scrape_many); only boot Chrome if that fails
+            prefetched = self._prefetched.pop(url, None)
+            game_links = prefetched.result() if prefetched is not None else self._try_http_extract(url)
+            
+            if gdrive_check is not None:
+                gdrive_exists, gdrive_file_id = gdrive_check.result()
                 if gdrive_exists:
                     self.logger.info(f"Data for {gender} {division} on {year}-{month}-{day} already exists in Google Drive, skipping...")
                     return []
             
             self.logger.info(f"Processing: {csv_path}")
             
-            # Initialize driver with retry mechanism
-            try:
-                self.driver = SeleniumUtils.create_driver(headless=True, max_retries=3)
-            except Exception as e:
-                error_msg = f"Failed to initialize WebDriver: {e}"
-                self.logger.error(error_msg)
-                self.send_notification(
-                    error_msg,
-                    ErrorType.ERROR,
-                    division=division,
-                    date=f"{year}-{month}-{day}",
-                    gender=gender
-                )
-                return []
+            if game_links is None:
+                game_links = self._extract_game_links_with_selenium(url, division, gender, f"{year}-{month}-{day}")
+                if game_links is None:
+                    return []
             
             try:
-                # Load scoreboard page
-                if not self._load_scoreboard_page(url, division, gender, f"{year}-{month}-{day}"):
-                    return []
-                
-                # Get game links (pass URL for retry purposes)
-                game_links = self._extract_game_links(url)
                 if not game_links:
                     no_links_msg = f"No valid game links found for {url}"
                     self.logger.warning(no_links_msg)
@@ -103,90 +305,67 @@ class NCAAScraper(BaseScraper):
                     )
                     return []
                 
-                # Filter links - keep cross-division duplicates, skip same-division duplicates
+                # Games scraped for another division in an earlier run can be copied too
+                if not getattr(self, 'force_rescrape', False):
+                    for link, previous_division in self.visited_store.get_divisions(game_links).items():
+                        if previous_division != division:
+                            self.visited_links.setdefault(link, previous_division)
+                
+                # Filter links - group cross-division duplicates by source division, skip same-division duplicates
                 new_links = []
-                cross_division_duplicates = []
+                cross_div_by_source: Dict[str, List[str]] = defaultdict(list)
                 for link in game_links:
                     if link in self.visited_links:
                         # Check if it was visited in a different division
                         previous_division = self.visited_links[link]
                         if previous_division != division:
-                            # Cross-division duplicate - scrape it but mark it
-                            cross_division_duplicates.append(link)
-                            new_links.append(link)
+                            # Cross-division duplicate - copy it from the source division's CSV
+                            cross_div_by_source[previous_division].append(link)
                         # If same division, skip it (already visited in this division)
                     else:
                         # Not visited yet
                         new_links.append(link)
                 
-                skipped_count = len(game_links) - len(new_links)
+                cross_division_count = sum(len(links) for links in cross_div_by_source.values())
+                skipped_count = len(game_links) - len(new_links) - cross_division_count
                 
                 if skipped_count > 0:
                     self.logger.info(f"Found {len(game_links)} total games, {skipped_count} already visited in same division, {len(new_links)} new games to scrape")
                 else:
                     self.logger.info(f"Found {len(game_links)} games to scrape")
                 
-                if cross_division_duplicates:
-                    self.logger.info(f"Found {len(cross_division_duplicates)} cross-division duplicate games that will be marked")
+                if cross_division_count:
+                    self.logger.info(f"Found {cross_division_count} cross-division duplicate games that will be copied and marked")
                 
-                # Scrape each game
-                scraped_games = []
-                for idx, game_link in enumerate(new_links):
-                    try:
-                        # Recreate driver every 20 games to prevent memory/resource buildup
-                        if idx > 0 and idx % 20 == 0:
-                            self.logger.info(f"Recreating driver after {idx} games to prevent resource buildup...")
-                            try:
-                                # Aggressive cleanup before recreating
-                                SeleniumUtils._cleanup_driver_resources()
-                                SeleniumUtils.safe_quit_driver(self.driver)
-                            except Exception as e:
-                                self.logger.warning(f"Error quitting old driver: {e}")
-                            
-                            # Wait a bit for processes to fully terminate
-                            time.sleep(3)
-                            
-                            # Create new driver
-                            try:
-                                self.driver = SeleniumUtils.create_driver(headless=True, max_retries=3)
-                            except Exception as e:
-                                self.logger.error(f"Failed to recreate driver: {e}")
-                                # Try once more with longer cleanup
-                                SeleniumUtils._cleanup_driver_resources()
-                                time.sleep(5)
-                                try:
-                                    self.driver = SeleniumUtils.create_driver(headless=True, max_retries=3)
-                                except Exception as e2:
-                                    self.logger.error(f"Failed to recreate driver after cleanup: {e2}")
-                                    return scraped_games  # Return what we have so far
-                        
-                        game_data = self._scrape_single_game(
-                            game_link, year, month, day, gender, division, csv_path
-                        )
-                        if game_data:
-                            scraped_games.append(game_data)
-                            # Update visited_links with current division
-                            self.visited_links[game_link] = division
-                    except Exception as e:
-                        self.logger.error(f"Error scraping game {game_link}: {e}")
-                        self.send_notification(
-                            f"Error scraping game: {e}",
-                            ErrorType.GAME_ERROR,
-                            division=division,
-                            date=f"{year}-{month}-{day}",
-                            gender=gender,
-                            game_link=game_link
-                        )
-                        continue
+                # Read the division's existing game IDs once instead of re-reading the CSV per game
+                existing_ids = self.csv_handler.get_existing_game_ids(csv_path)
+                scraped_games = self._scrape_game_links(
+                    new_links, year, month, day, gender, division, csv_path, existing_ids
+                )
+                
+                # Copy cross-division duplicates in one batch per source CSV; scrape any that couldn't be copied
+                uncopied_links = self._copy_cross_division_games(
+                    cross_div_by_source, year, month, day, gender, division, csv_path
+                )
+                if uncopied_links:
+                    scraped_games += self._scrape_game_links(
+                        uncopied_links, year, month, day, gender, division, csv_path, existing_ids
+                    )
+                
+                # Write out the division's buffered games before the file is uploaded
+                flushed = self.csv_handler.flush_pending(csv_path)
                 
                 # Upload to Google Drive if enabled
-                if self.config.upload_to_gdrive and self.file_manager.file_exists_and_has_content(csv_path):
-                    self.logger.info(f"Uploading completed CSV for {gender} {division}: {csv_path}")
-                    self.upload_to_gdrive(csv_path, year, month, gender, division)
+                if not flushed:
+                    self.logger.error(f"Not uploading {csv_path}: some game data could not be written")
+                elif self.config.upload_to_gdrive and self.file_manager.file_exists_and_has_content(csv_path):
+                    self.logger.info(f"Queuing upload of completed CSV for {gender} {division}: {csv_path}")
+                    self.upload_to_gdrive_async(csv_path, year, month, gender, division)
                 
                 return scraped_games
                 
             finally:
+                self.csv_handler.flush_pending(csv_path)
                 if self.driver:
                     SeleniumUtils.safe_quit_driver(self.driver)
                     self.driver = None
@@ -196,39 +375,335 @@ class NCAAScraper(BaseScraper):
             self.send_notification(
                 f"Unexpected error in scrape method: {e}",
                 ErrorType.ERROR,
-                division=components.get('division') if 'components' in locals() else None,
-                date=f"{components.get('year')}-{components.get('month')}-{components.get('day')}" if 'components' in locals() else None,
-                gender=components.get('gender') if 'components' in locals() else None
+                division=components.division if 'components' in locals() else None,
+                date=f"{components.year}-{components.month}-{components.day}" if 'components' in locals() else None,
+                gender=components.gender if 'components' in locals() else None
             )
             return []
     
-    def _load_scoreboard_page(self, url: str, division: str, gender: str, date: str) -> bool:
-        """Load the scoreboard page and check for errors."""
+    def _extract_game_links_with_selenium(
+        self,
+        url: str,
+        division: str,
+        gender: str,
+        date: str
+    ) -> Optional[List[str]]:
+        """
+        Load a scoreboard in Chrome and extract its game links.
+        
+        Used when the HTTP fast path can't read the scoreboard (e.g. it needs rendering).
+        
+        Args:
+            url: Scoreboard URL
+            division: Division (d1, d2, d3)
+            gender: Gender (men, women)
+            date: Date in YYYY-MM-DD format
+        
+        Returns:
+            List of game links (possibly empty), or None if the driver or page failed
+        """
         try:
-            self.logger.info(f"Loading scoreboard page: {url}")
+            if self._pool:
+                self.driver = self._pool.acquire()
+            else:
+                self.driver = SeleniumUtils.create_driver(headless=True, max_retries=3)
+        except Exception as e:
+            error_msg = f"Failed to initialize WebDriver: {e}"
+            self.logger.error(error_msg)
+            self.send_notification(
+                error_msg,
+                ErrorType.ERROR,
+                division=division,
+                date=date,
+                gender=gender
+            )
+            return None
+        
+        try:
+            if not self._load_scoreboard_page(url, division, gender, date):
+                return None
             
-            # Visit main page first to establish session (for stats.ncaa.org)
+            # Pass URL for retry purposes
+            return self._extract_game_links(url)
+        finally:
+            # The scoreboard driver isn't needed any more; game workers bring their own
+            if self._pool:
+                self._pool.release(self.driver)
+            elif self.driver:
+                SeleniumUtils.safe_quit_driver(self.driver)
+            self.driver = None
+    
+    def _scrape_game_links(
+        self,
+        game_links: List[str],
+        year: str,
+        month: str,
+        day: str,
+        gender: str,
+        division: str,
+        csv_path: str,
+        existing_ids: Optional[Set[str]] = None
+    ) -> List[GameData]:
+        """
+        Scrape game pages concurrently with drivers borrowed from a WebDriverPool.
+        
+        Args:
+            game_links: Game links to scrape
+            year: Year
+            month: Month
+            day: Day
+            gender: Gender (men, women)
+            division: Division (d1, d2, d3)
+            csv_path: CSV file the games are appended to
+            existing_ids: Game IDs already in csv_path (read from the CSV if None)
+        
+        Returns:
+            Scraped game data, in the order of game_links
+        """
+        if existing_ids is None:
+            existing_ids = self.csv_handler.get_existing_game_ids(csv_path)
+        
+        def scrape_one(game_link: str) -> Optional[GameData]:
             try:
-                self.logger.info("Visiting stats.ncaa.org to establish session...")
-                SeleniumUtils.safe_driver_operation(
-                    self.driver,
-                    lambda: self.driver.get("https://stats.ncaa.org"),
-                    timeout=30,
-                    operation_name="visit stats.ncaa.org main page"
-                )
-                time.sleep(3)  # Let cookies/session establish
+                # A driver is only borrowed if the game can't be read over plain HTTP
+                with self.using_pool(pool):
+                    game_data = self._scrape_single_game(
+                        game_link, year, month, day, gender, division, csv_path,
+                        existing_ids=existing_ids
+                    )
+                return game_data
             except Exception as e:
-                self.logger.warning(f"Could not visit main page first: {e}, continuing anyway...")
+                self.logger.error(f"Error scraping game {game_link}: {e}")
+                self.send_notification(
+                    f"Error scraping game: {e}",
+                    ErrorType.GAME_ERROR,
+                    division=division,
+                    date=f"{year}-{month}-{day}",
+                    gender=gender,
+                    game_link=game_link
+                )
+                return None
+        
+        max_workers = max(1, min(self.config.max_workers, len(game_links)))
+        pool = self._pool or WebDriverPool(size=max_workers)
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(scrape_one, game_links))
+        finally:
+            if pool is not self._pool:
+                pool.close()
+        
+        scraped_games = [game_data for game_data in results if game_data]
+        # Games only count as done once their buffered rows are on disk
+        if not self.csv_handler.flush_pending(csv_path):
+            self.logger.error(f"Failed to write {len(scraped_games)} scraped games to {csv_path}, they will be scraped again")
+            existing_ids.difference_update(game_data.game_id for game_data in scraped_games)
+            return []
+        
+        for game_data in scraped_games:
+            # Update visited_links with current division
+            self._mark_visited(game_data.game_link, division)
+        return scraped_games
+    
+    def _copy_cross_division_games(
+        self,
+        cross_div_by_source: Dict[str, List[str]],
+        year: str,
+        month: str,
+        day: str,
+        gender: str,
+        division: str,
+        csv_path: str
+    ) -> List[str]:
+        """
+        Copy games already scraped in other divisions into this division's CSV.
+        
+        Each source CSV is read, flagged and rewritten once, its rows are appended
+        here in one write, and it is uploaded once, however many games it shares.
+        
+        Args:
+            cross_div_by_source: Game links grouped by the division they were scraped in
+            year: Year
+            month: Month
+            day: Day
+            gender: Gender (men, women)
+            division: Division being scraped (d1, d2, d3)
+            csv_path: CSV file for this division
+        
+        Returns:
+            Game links that could not be copied and still need scraping
+        """
+        uncopied_links = []
+        
+        for previous_division, links in cross_div_by_source.items():
+            previous_csv_path = self.file_manager.get_csv_path(year, month, day, gender, previous_division)
+            
+            # Flag the games in the source CSV and get their rows back
+            duplicate_rows = self.csv_handler.mark_duplicate_games(previous_csv_path, links)
+            if duplicate_rows is None or duplicate_rows.empty:
+                self.logger.warning(f"Could not find existing game data in {previous_division} CSV, will scrape instead")
+                uncopied_links.extend(links)
+                continue
             
-            # Add human-like delay before loading
-            SeleniumUtils.human_like_delay(1.0, 2.0)
+            if self.config.upload_to_gdrive:
+                self.logger.info(f"Queuing upload of updated CSV with duplicate flags to Google Drive: {previous_csv_path}")
+                self.upload_to_gdrive_async(previous_csv_path, year, month, gender, previous_division)
+            
+            if not self.csv_handler.append_game_data(csv_path, duplicate_rows):
+                self.logger.error(f"Failed to copy game data to {division} CSV")
+                uncopied_links.extend(links)
+                continue
+            
+            copied_links = set(duplicate_rows['GAMELINK'])
+            for link in links:
+                if link in copied_links:
+                    # Update visited_links with current division
+                    self._mark_visited(link, division)
+                else:
+                    uncopied_links.append(link)
+            self.logger.info(f"Copied {len(copied_links)} games from {previous_division} to {division} CSV")
+        
+        return uncopied_links
+    
+    def _mark_visited(self, game_link: str, division: str):
+        """Record that a game link's data is now in the given division's CSV, for this and later runs."""
+        self.visited_links[game_link] = division
+        self.visited_store.add(game_link, division)
+    
+    def _parse_game_links(self, html: str) -> List[str]:
+        """
+        Parse individual_stats game links out of scoreboard HTML.
+        
+        Args:
+            html: Scoreboard page HTML
+        
+        Returns:
+            List of game links in page order, without duplicates
+        """
+        tree = lxml.html.fromstring(html)
+        
+        # Each game is a card inside a row; the card's table holds the box score link
+        hrefs = [
+            href for href in SCOREBOARD_BOX_SCORE_HREFS_XPATH(tree)
+            if BOX_SCORE_HREF_PATTERN.search(href)
+        ]
+        return self._game_links_from_hrefs(hrefs)
+    
+    def _game_links_from_hrefs(self, hrefs: List[str]) -> List[str]:
+        """
+        Convert box score hrefs into individual_stats game links.
+        
+        Args:
+            hrefs: Box score hrefs in page order
+        
+        Returns:
+            List of game links in page order, without duplicates
+        """
+        game_links = []
+        seen_contest_ids = set()  # Track contest IDs to avoid duplicates
+        
+        for href in hrefs:
+            contest_id_match = CONTEST_ID_PATTERN.search(href or '')
+            if contest_id_match:
+                contest_id = contest_id_match.group(1)
+                if contest_id not in seen_contest_ids:
+                    seen_contest_ids.add(contest_id)
+                    game_links.append(GAME_LINK_TEMPLATE.format(contest_id))
+        
+        return game_links
+    
+    def _http_session(self) -> requests.Session:
+        """
+        Get the calling thread's keep-alive HTTP session, creating it on first use.
+        
+        Returns:
+            Session with browser-like headers and retries on transient errors
+        """
+        session = getattr(self._local, 'http_session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(HTTP_HEADERS)
+            adapter = HTTPAdapter(
+                pool_connections=HTTP_POOL_SIZE,
+                pool_maxsize=HTTP_POOL_SIZE,
+                max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504))
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            self._local.http_session = session
+        return session
+    
+    def _try_http_extract(self, url: str) -> Optional[List[str]]:
+        """
+        Extract game links from a scoreboard with a plain HTTP request, bypassing Selenium.
+        
+        Args:
+            url: Scoreboard URL
+        
+        Returns:
+            List of game links, or None if the page could not be fetched or parsed
+            (callers should fall back to the Selenium path)
+        """
+        try:
+            self.rate_limiter.acquire(url)
+            response = self._http_session().get(url, timeout=HTTP_TIMEOUT)
+            if response.status_code != 200:
+                self.logger.info(f"HTTP fetch of {url} returned {response.status_code}, falling back to Selenium")
+                return None
+            
+            game_links = self._parse_game_links(response.text)
+            if not game_links:
+                self.logger.info(f"No game links in HTTP response for {url}, falling back to Selenium")
+                return None
+            
+            self.logger.info(f"Found {len(game_links)} game links via HTTP")
+            return game_links
+            
+        except requests.RequestException as e:
+            self.logger.info(f"HTTP fetch of {url} failed ({e}), falling back to Selenium")
+            return None
+    
+    def _ensure_session_initialized(self):
+        """
+        Visit stats.ncaa.org once per browser session to establish its cookies.
+        
+        Cookies persist for the life of the browser, so later scoreboard loads and
+        retries in the same session skip the extra page load.
+        """
+        session_id = getattr(self.driver, 'session_id', None)
+        with self._drivers_lock:
+            if session_id in self._initialized_sessions:
+                return
+        
+        try:
+            self.logger.info("Visiting stats.ncaa.org to establish session...")
+            SeleniumUtils.safe_driver_operation(
+                self.driver,
+                lambda: self.driver.get("https://stats.ncaa.org"),
+                timeout=30,
+                operation_name="visit stats.ncaa.org main page"
+            )
+            SeleniumUtils.wait_ready(self.driver)
+            with self._drivers_lock:
+                self._initialized_sessions.add(session_id)
+        except Exception as e:
+            self.logger.warning(f"Could not visit main page first: {e}, continuing anyway...")
+    
+    def _load_scoreboard_page(self, url: str, division: str, gender: str, date: str) -> bool:
+        """Load the scoreboard page and check for errors."""
+        try:
+            self.logger.info(f"Loading scoreboard page: {url}")
+            
+            # Visit main page first to establish session (once per browser session)
+            self._ensure_session_initialized()
             
             # Navigate with timeout handling and protection against read timeouts
             try:
+                self.rate_limiter.acquire(url)
                 # Use safe_driver_operation to prevent read timeout errors
                 load_success = SeleniumUtils.safe_driver_operation(
                     self.driver,
-                    lambda: self.driver.get(url),
+                    lambda: self.driver.get(url) or True,
                     timeout=90,  # 90 seconds max (longer than page_load_timeout of 60s)
                     operation_name=f"load scoreboard page {url}"
                 )
@@ -236,153 +711,54 @@ class NCAAScraper(BaseScraper):
                 if load_success is None:
                     # Page load hung - force stop
                     self.logger.warning(f"Page load hung for scoreboard {url}, attempting recovery...")
-                    try:
-                        SeleniumUtils.safe_driver_operation(
-                            self.driver,
-                            lambda: self.driver.execute_script("window.stop();"),
-                            timeout=5,
-                            operation_name="stop page load"
-                        )
-                        time.sleep(1)
-                    except Exception:
-                        # Driver is stuck - recreate it
-                        self.logger.warning("Driver unresponsive, recreating...")
-                        try:
-                            SeleniumUtils.safe_quit_driver(self.driver)
-                            self.driver = SeleniumUtils.create_driver(headless=True, max_retries=3)
-                            # Retry the page load once
-                            load_success = SeleniumUtils.safe_driver_operation(
-                                self.driver,
-                                lambda: self.driver.get(url),
-                                timeout=90,
-                                operation_name=f"retry load scoreboard page {url}"
-                            )
-                            if load_success is None:
-                                self.logger.error(f"Page load still hung after driver recreation for {url}")
-                                return False
-                            # Give page time to stabilize after recovery
-                            time.sleep(3)
-                        except Exception as e2:
-                            self.logger.error(f"Failed to recreate driver: {e2}")
-                            return False
+                    if not self._stop_page_load() and not self._reload_with_recovery(url):
+                        return False
                             
             except TimeoutException:
                 self.logger.warning(f"Page load timeout for scoreboard {url}, attempting recovery...")
-                try:
-                    SeleniumUtils.safe_driver_operation(
-                        self.driver,
-                        lambda: self.driver.execute_script("window.stop();"),
-                        timeout=5,
-                        operation_name="stop page load"
-                    )
-                    time.sleep(1)
-                except Exception:
-                    # Driver is stuck - recreate it
-                    self.logger.warning("Driver unresponsive, recreating...")
-                    try:
-                        SeleniumUtils.safe_quit_driver(self.driver)
-                        self.driver = SeleniumUtils.create_driver(headless=True, max_retries=3)
-                        # Retry the page load once
-                        load_success = SeleniumUtils.safe_driver_operation(
-                            self.driver,
-                            lambda: self.driver.get(url),
-                            timeout=90,
-                            operation_name=f"retry load scoreboard page {url}"
-                        )
-                        if load_success is None:
-                            self.logger.error(f"Failed to load page after driver recreation: {url}")
-                            return False
-                        # Give page time to stabilize after recovery
-                        time.sleep(3)
-                    except Exception as e2:
-                        self.logger.error(f"Failed to recreate driver: {e2}")
-                        return False
+                if not self._stop_page_load() and not self._reload_with_recovery(url):
+                    return False
             except Exception as e:
                 # Catch ANY exception during get() - driver might be frozen
-                error_str = str(e)
-                if "HTTPConnectionPool" in error_str or "Read timed out" in error_str:
+                if SeleniumUtils.is_driver_unresponsive(e):
                     self.logger.error(f"Driver frozen/unresponsive during scoreboard load for {url}: {e}")
-                    # Recreate driver and retry once
-                    try:
-                        SeleniumUtils.safe_quit_driver(self.driver)
-                        self.driver = SeleniumUtils.create_driver(headless=True, max_retries=3)
-                        # Retry the page load once
-                        load_success = SeleniumUtils.safe_driver_operation(
-                            self.driver,
-                            lambda: self.driver.get(url),
-                            timeout=90,
-                            operation_name=f"retry load scoreboard page {url}"
-                        )
-                        if load_success is None:
-                            self.logger.error(f"Failed to load page after driver recreation: {url}")
-                            return False
-                        # Give page time to stabilize after recovery
-                        time.sleep(3)
-                    except Exception as e2:
-                        self.logger.error(f"Failed to recreate driver: {e2}")
+                    if not self._reload_with_recovery(url):
                         return False
                 else:
                     # Re-raise other exceptions
                     raise
             
-            # Add another delay after page load to ensure stability
-            SeleniumUtils.human_like_delay(2.0, 4.0)
-            
             # Verify driver is responsive before proceeding with a more robust health check
             try:
                 # Try a simple operation to verify driver health
                 test_result = SeleniumUtils.safe_driver_operation(
                     self.driver,
-                    lambda: len(self.driver.find_elements(By.TAG_NAME, "body")),
+                    lambda: len(self.driver.find_elements(*BODY_LOCATOR)),
                     timeout=5,
                     default_return=0,
                     operation_name="driver health check"
                 )
                 if test_result == 0:
                     self.logger.warning("Driver health check failed (no body elements found), recreating driver...")
-                    try:
-                        SeleniumUtils.safe_quit_driver(self.driver)
-                        self.driver = SeleniumUtils.create_driver(headless=True, max_retries=3)
-                        # Reload page
-                        load_success = SeleniumUtils.safe_driver_operation(
-                            self.driver,
-                            lambda: self.driver.get(url),
-                            timeout=90,
-                            operation_name="reload after driver recreation"
-                        )
-                        if load_success is None:
-                            self.logger.error(f"Failed to reload page after driver recreation: {url}")
-                            return False
-                        time.sleep(3)
-                    except Exception as e2:
-                        self.logger.error(f"Failed to recreate driver during health check: {e2}")
+                    if not self._reload_with_recovery(url):
                         return False
             except Exception as e:
                 self.logger.warning(f"Driver health check error: {e}, attempting driver recreation...")
-                try:
-                    SeleniumUtils.safe_quit_driver(self.driver)
-                    self.driver = SeleniumUtils.create_driver(headless=True, max_retries=3)
-                    load_success = SeleniumUtils.safe_driver_operation(
-                        self.driver,
-                        lambda: self.driver.get(url),
-                        timeout=90,
-                        operation_name="reload after driver recreation"
-                    )
-                    if load_success is None:
-                        self.logger.error(f"Failed to reload page after driver recreation: {url}")
-                        return False
-                    time.sleep(3)
-                except Exception as e2:
-                    self.logger.error(f"Failed to recreate driver during health check: {e2}")
+                if not self._reload_with_recovery(url):
                     return False
             
             # Wait for page to load
-            wait = WebDriverWait(self.driver, self.config.wait_timeout)
+            wait = WebDriverWait(self.driver, self.config.wait_timeout, poll_frequency=WAIT_POLL_FREQUENCY)
             
-            # If the page explicitly shows a no-games message, treat as non-error and stop
             try:
-                no_games = self.driver.find_elements(By.CLASS_NAME, "no-games-message")
-                if no_games:
+                # Wait only for what is scraped: a game card's table (or the no-games message)
+                found = wait.until(EC.any_of(
+                    EC.presence_of_element_located(SCOREBOARD_READY_LOCATOR),
+                    EC.presence_of_element_located(NO_GAMES_LOCATOR)
+                ))
+                
+                # If the page explicitly shows a no-games message, treat as non-error and stop
+                if NO_GAMES_CLASS in SeleniumUtils.safe_get_attribute(found, 'class').split():
                     no_games_msg = f"No games found on scoreboard page: {url}"
                     self.logger.info(no_games_msg)
                     self.send_notification(
@@ -393,24 +769,12 @@ class NCAAScraper(BaseScraper):
                         gender=gender
                     )
                     return False
-            except Exception:
-                # If this probe fails, continue with normal flow
-                pass
-            
-            try:
-                # Wait for body to be present (stats.ncaa.org structure)
-                wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-                time.sleep(2)  # Additional wait for content to load
                 return True
             except TimeoutException:
                 # Check if page loaded but just has no games
                 try:
-                    html = self.driver.page_source
-                    soup = BeautifulSoup(html, 'html.parser')
-                    rows = soup.find_all('div', class_='row')
-                    cards = []
-                    for row in rows:
-                        cards.extend(row.find_all('div', class_='card'))
+                    # Counted in the browser rather than shipping the page source back to parse
+                    cards = self.driver.find_elements(*SCOREBOARD_CARD_LOCATOR)
                     if not cards:
                         no_games_msg = f"No games found on scoreboard page: {url}"
                         self.logger.info(no_games_msg)
@@ -485,44 +849,95 @@ class NCAAScraper(BaseScraper):
             )
             return False
     
+    def _stop_page_load(self) -> bool:
+        """
+        Stop a hung page load in the calling thread's driver.
+        
+        Returns:
+            True if the driver responded, False if it is stuck and must be recovered
+        """
+        try:
+            SeleniumUtils.safe_driver_operation(
+                self.driver,
+                lambda: self.driver.execute_script("window.stop();"),
+                timeout=5,
+                operation_name="stop page load"
+            )
+            SeleniumUtils.wait_ready(self.driver)
+            return True
+        except Exception:
+            return False
+    
+    def _reload_with_recovery(self, url: str) -> bool:
+        """
+        Recover the calling thread's driver (see _recover_frozen_driver) and load a page in it.
+        
+        Args:
+            url: Page to load once the driver works again
+        
+        Returns:
+            True if the page loaded, False otherwise
+        """
+        self.logger.warning(f"Driver unresponsive, recovering it before reloading {url}")
+        if not self._recover_frozen_driver():
+            return False
+        
+        try:
+            load_success = SeleniumUtils.safe_driver_operation(
+                self.driver,
+                lambda: self.driver.get(url) or True,
+                timeout=90,
+                operation_name=f"reload {url} after driver recovery"
+            )
+            if load_success is None:
+                self.logger.error(f"Failed to load page after driver recovery: {url}")
+                return False
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to load page after driver recovery: {url}: {e}")
+            return False
+    
     def _extract_game_links(self, scoreboard_url: Optional[str] = None) -> List[str]:
-        """Extract game links from the scoreboard page using BeautifulSoup."""
+        """Extract game links from the scoreboard page loaded in the driver."""
         max_retries = 3
         
         for attempt in range(max_retries):
             try:
                 if attempt > 0:
-                    delay = 2 * (attempt)  # 2s, 4s delays
-                    self.logger.info(f"Retrying game link extraction (attempt {attempt + 1}/{max_retries}) after {delay}s delay")
+                    # Exponential backoff with jitter, capped at 30s
+                    delay = min(30, 2 ** attempt + random.uniform(0, 1))
+                    self.logger.info(f"Retrying game link extraction (attempt {attempt + 1}/{max_retries}) after {delay:.1f}s delay")
                     time.sleep(delay)
                     
-                    # If retrying, reload the page to ensure fresh state
-                    if scoreboard_url:
+                    # Cards that were still rendering usually show up by now; re-read them before paying for a reload
+                    card_count = SeleniumUtils.safe_driver_operation(
+                        self.driver,
+                        lambda: len(self.driver.find_elements(*SCOREBOARD_CARD_LOCATOR)),
+                        timeout=5,
+                        default_return=0,
+                        operation_name="probe scoreboard cards"
+                    )
+                    
+                    # Only reload the page if it is still empty
+                    if scoreboard_url and not card_count:
                         self.logger.info("Reloading scoreboard page before retry...")
                         try:
-                            # Visit main page first
-                            SeleniumUtils.safe_driver_operation(
-                                self.driver,
-                                lambda: self.driver.get("https://stats.ncaa.org"),
-                                timeout=30,
-                                operation_name="visit stats.ncaa.org before retry"
-                            )
-                            time.sleep(2)
+                            # Visit main page first (skipped if this browser already did)
+                            self._ensure_session_initialized()
                             SeleniumUtils.safe_driver_operation(
                                 self.driver,
                                 lambda url=scoreboard_url: self.driver.get(url),
                                 timeout=90,
                                 operation_name="reload scoreboard page for retry"
                             )
-                            time.sleep(3)
+                            SeleniumUtils.wait_ready(self.driver)
                         except Exception as e:
                             self.logger.warning(f"Error reloading page for retry: {e}")
                 
-                # Wait for page to be ready
+                # Wait for the game cards to be in the DOM
                 try:
-                    wait = WebDriverWait(self.driver, self.config.wait_timeout)
-                    wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-                    time.sleep(2)  # Additional wait for content
+                    wait = WebDriverWait(self.driver, self.config.wait_timeout, poll_frequency=WAIT_POLL_FREQUENCY)
+                    wait.until(EC.presence_of_element_located(SCOREBOARD_READY_LOCATOR))
                 except TimeoutException:
                     if attempt < max_retries - 1:
                         self.logger.warning(f"Page not ready, retrying...")
@@ -530,55 +945,16 @@ class NCAAScraper(BaseScraper):
                     self.logger.warning("Page not ready after all retries")
                     return []
                 
-                # Get page source and parse with BeautifulSoup
-                html = SeleniumUtils.safe_driver_operation(
+                # Collect every box score href in one script call instead of shipping the page source
+                hrefs = SeleniumUtils.safe_driver_operation(
                     self.driver,
-                    lambda: self.driver.page_source,
+                    lambda: self.driver.execute_script(BOX_SCORE_HREFS_SCRIPT),
                     timeout=30,
-                    default_return="",
-                    operation_name="get page source for parsing"
+                    default_return=[],
+                    operation_name="bulk extract box score hrefs"
                 )
                 
-                if not html:
-                    if attempt < max_retries - 1:
-                        continue
-                    return []
-                
-                # Parse with BeautifulSoup (like altscraper.py)
-                soup = BeautifulSoup(html, 'html.parser')
-                game_links = []
-                seen_contest_ids = set()  # Track contest IDs to avoid duplicates
-                
-                # Find all rows
-                rows = soup.find_all('div', class_='row')
-                
-                for row in rows:
-                    # Find all cards in this row (each card is a game)
-                    cards = row.find_all('div', class_='card')
-                    
-                    for card in cards:
-                        try:
-                            # Find the table
-                            table = card.find('table')
-                            if not table:
-                                continue
-                            
-                            # Find box score link
-                            box_score_link_elem = table.find('a', href=re.compile(r'/contests/\d+/box_score'))
-                            if box_score_link_elem:
-                                box_score_path = box_score_link_elem.get('href', '')
-                                # Convert to individual_stats URL
-                                contest_id_match = re.search(r'/contests/(\d+)/', box_score_path)
-                                if contest_id_match:
-                                    contest_id = contest_id_match.group(1)
-                                    # Only add if we haven't seen this contest ID before
-                                    if contest_id not in seen_contest_ids:
-                                        seen_contest_ids.add(contest_id)
-                                        game_link = f"https://stats.ncaa.org/contests/{contest_id}/individual_stats"
-                                        game_links.append(game_link)
-                        except Exception as e:
-                            self.logger.warning(f"Error parsing game card: {e}")
-                            continue
+                game_links = self._game_links_from_hrefs(hrefs or [])
                 
                 if not game_links:
                     if attempt < max_retries - 1:
@@ -587,50 +963,17 @@ class NCAAScraper(BaseScraper):
                     self.logger.warning("No game links found after all retries")
                     return []
                 
-                # Additional deduplication check (in case of any edge cases)
-                unique_links = list(dict.fromkeys(game_links))  # Preserves order while removing duplicates
-                if len(unique_links) < len(game_links):
-                    self.logger.info(f"Removed {len(game_links) - len(unique_links)} duplicate game links")
-                
-                self.logger.info(f"Found {len(unique_links)} unique game links")
-                return unique_links
+                # _game_links_from_hrefs already drops repeated contest IDs
+                self.logger.info(f"Found {len(game_links)} unique game links")
+                return game_links
                     
             except Exception as e:
-                error_str = str(e)
-                if "HTTPConnectionPool" in error_str or "Read timed out" in error_str:
+                if SeleniumUtils.is_driver_unresponsive(e):
                     self.logger.error(f"Driver frozen during link extraction (attempt {attempt + 1}/{max_retries}): {e}")
                     if attempt < max_retries - 1:
-                        # Recreate driver and retry
-                        try:
-                            SeleniumUtils._cleanup_driver_resources()
-                            SeleniumUtils.safe_quit_driver(self.driver)
-                        except Exception as e2:
-                            self.logger.warning(f"Error during cleanup: {e2}")
-                        
-                        time.sleep(5)
-                        
-                        try:
-                            self.driver = SeleniumUtils.create_driver(headless=True, max_retries=3)
-                            # Visit main page first, then reload scoreboard
-                            if scoreboard_url:
-                                SeleniumUtils.safe_driver_operation(
-                                    self.driver,
-                                    lambda: self.driver.get("https://stats.ncaa.org"),
-                                    timeout=30,
-                                    operation_name="visit stats.ncaa.org before retry"
-                                )
-                                time.sleep(2)
-                                SeleniumUtils.safe_driver_operation(
-                                    self.driver,
-                                    lambda url=scoreboard_url: self.driver.get(url),
-                                    timeout=90,
-                                    operation_name="reload scoreboard page"
-                                )
-                                time.sleep(2)
-                        except Exception as e2:
-                            self.logger.error(f"Failed to recreate driver: {e2}")
-                            if attempt < max_retries - 1:
-                                continue
+                        # The next attempt reloads the scoreboard if the recovered driver has no cards
+                        self._recover_frozen_driver()
+                        continue
                     else:
                         self.logger.error(f"Failed to extract game links after all retries: {e}")
                         return []
@@ -653,354 +996,58 @@ class NCAAScraper(BaseScraper):
         gender: str, 
         division: str,
         csv_path: str,
-        is_duplicate_from_mapping: bool = False
+        is_duplicate_from_mapping: bool = False,
+        existing_ids: Optional[Set[str]] = None
     ) -> Optional[GameData]:
         """Scrape a single game's individual stats data."""
         game_id = extract_game_id_from_url(game_link)
         
-        # Check if game already exists in CSV
-        if self.is_duplicate(game_id, csv_path):
+        # Check if game already exists in CSV (preloaded IDs avoid a CSV read per game)
+        already_saved = game_id in existing_ids if existing_ids is not None else self.is_duplicate(game_id, csv_path)
+        if already_saved:
             self.logger.info(f"Game {game_id} already exists in {csv_path}, skipping...")
             return None
         
-        # Check if already visited in this session
-        if game_link in self.visited_links:
-            previous_division = self.visited_links[game_link]
-            if previous_division == division:
-                # Same division - skip
-                self.logger.info(f"Game link {game_link} already visited in this session for {division}, skipping...")
-                return None
-            else:
-                # Different division - reuse existing data instead of rescraping
-                self.logger.info(f"Game link {game_link} already scraped in {previous_division}, reusing existing data for {division}")
-                
-                # Get the CSV path for the previous division
-                previous_csv_path = self.file_manager.get_csv_path(year, month, day, gender, previous_division)
-                
-                # Read the game data from the previous division's CSV
-                existing_game_data = self.csv_handler.get_game_data_by_link(previous_csv_path, game_link)
-                
-                if existing_game_data is not None and not existing_game_data.empty:
-                    # Update the previous division's CSV to mark it as duplicate
-                    if self.csv_handler.update_duplicate_flag(previous_csv_path, game_link, duplicate_value=True):
-                        # Upload updated CSV to Google Drive if enabled
-                        if self.config.upload_to_gdrive:
-                            self.logger.info(f"Uploading updated CSV with duplicate flag to Google Drive: {previous_csv_path}")
-                            self.upload_to_gdrive(previous_csv_path, year, month, gender, previous_division)
-                    
-                    # Copy the data to current division's CSV with duplicate flag set
-                    existing_game_data = existing_game_data.copy()
-                    
-                    # Ensure DUPLICATE_ACROSS_DIVISIONS column exists and set to True
-                    if 'DUPLICATE_ACROSS_DIVISIONS' not in existing_game_data.columns:
-                        existing_game_data['DUPLICATE_ACROSS_DIVISIONS'] = True
-                    else:
-                        existing_game_data['DUPLICATE_ACROSS_DIVISIONS'] = True
-                    
-                    # Append to current division's CSV
-                    if self.csv_handler.append_game_data(csv_path, existing_game_data):
-                        self.logger.info(f"Successfully copied game data from {previous_division} to {division} CSV")
-                        # Update visited_links with current division
-                        self.visited_links[game_link] = division
-                        return None  # Return None since we didn't create new GameData
-                    else:
-                        self.logger.error(f"Failed to copy game data to {division} CSV")
-                        # Fall through to scrape it anyway
-                else:
-                    self.logger.warning(f"Could not find existing game data in {previous_division} CSV, will scrape instead")
-                    # Fall through to scrape it
+        # Check if already visited in this session for this division
+        if self.visited_links.get(game_link) == division:
+            self.logger.info(f"Game link {game_link} already visited in this session for {division}, skipping...")
+            return None
         
         self.logger.info(f"Scraping: {game_link}")
         
         try:
-            # Navigate to individual stats page with timeout handling
-            try:
-                load_success = SeleniumUtils.safe_driver_operation(
-                    self.driver,
-                    lambda: self.driver.get(game_link),
-                    timeout=90,
-                    operation_name=f"load individual stats page {game_link}"
-                )
-                
-                if load_success is None:
-                    self.logger.warning(f"Page load hung for game {game_link}, attempting recovery...")
-                    try:
-                        SeleniumUtils.safe_driver_operation(
-                            self.driver,
-                            lambda: self.driver.execute_script("window.stop();"),
-                            timeout=5,
-                            operation_name="stop page load"
-                        )
-                        time.sleep(3)
-                    except Exception:
-                        self.logger.error(f"Driver unresponsive for {game_link}, skipping...")
+            # Games are final once scraped, so a cached copy saves fetching the page again
+            use_cache = self.use_cache and not getattr(self, 'force_rescrape', False)
+            teams = self.game_cache.get_teams(game_link) if use_cache else None
+            if teams is not None:
+                self.logger.info(f"Using cached stats for {game_link}")
+            else:
+                # Individual stats pages are server-rendered; only fall back to the browser if plain HTTP fails
+                with self.phase_timer.time("http_fetch"):
+                    html = self._try_http_game_html(game_link)
+                if html is None:
+                    with self.phase_timer.time("selenium_load"):
+                        html = self._load_game_html_with_selenium(game_link)
+                    if html is None:
                         return None
-                else:
-                    self.logger.info(f"Successfully navigated to: {game_link}")
-                    time.sleep(2)
-                    
-            except TimeoutException:
-                self.logger.warning(f"Page load timeout for game {game_link}, attempting recovery...")
-                try:
-                    SeleniumUtils.safe_driver_operation(
-                        self.driver,
-                        lambda: self.driver.execute_script("window.stop();"),
-                        timeout=5,
-                        operation_name="stop page load"
+                
+                with self.phase_timer.time("parse"):
+                    teams = self._parse_game_page(html, game_id, game_link)
+                if teams is None:
+                    error_msg = f"Could not parse individual stats for {game_link}"
+                    self.send_notification(
+                        error_msg,
+                        ErrorType.GAME_ERROR,
+                        division=division,
+                        date=f"{year}-{month}-{day}",
+                        gender=gender,
+                        game_link=game_link
                     )
-                    time.sleep(3)
-                except Exception:
-                    self.logger.error(f"Driver unresponsive for {game_link}, skipping...")
                     return None
-            except Exception as e:
-                error_str = str(e)
-                if "HTTPConnectionPool" in error_str or "Read timed out" in error_str:
-                    self.logger.error(f"Driver frozen/unresponsive during page load for {game_link}: {e}")
-                    try:
-                        SeleniumUtils._cleanup_driver_resources()
-                        SeleniumUtils.safe_quit_driver(self.driver)
-                    except Exception as e2:
-                        self.logger.warning(f"Error during cleanup: {e2}")
-                    
-                    time.sleep(5)
-                    
-                    try:
-                        self.driver = SeleniumUtils.create_driver(headless=True, max_retries=3)
-                    except Exception as e2:
-                        self.logger.error(f"Failed to recreate driver: {e2}")
-                        return None
-                    return None
-                else:
-                    raise
-            
-            # Wait for stat tables to actually appear in the DOM
-            wait = WebDriverWait(self.driver, self.config.wait_timeout)
-            try:
-                # Wait for at least one stat table to appear
-                wait.until(
-                    EC.presence_of_element_located(
-                        (By.CSS_SELECTOR, "table[id*='competitor_'][id*='_year_stat_category_0_data_table']")
-                    )
-                )
-                # Give it a moment for the second table to load
-                time.sleep(2)
-                self.logger.debug(f"Stat tables found in DOM for {game_link}")
-            except TimeoutException:
-                self.logger.warning(f"Stat tables not found in DOM for {game_link} after waiting, page may not be loaded properly")
-                # Still try to get page source in case tables are there but selector didn't match
-            
-            # Get page source and parse with BeautifulSoup
-            html = SeleniumUtils.safe_driver_operation(
-                self.driver,
-                lambda: self.driver.page_source,
-                timeout=30,
-                default_return="",
-                operation_name="get page source for parsing"
-            )
-            
-            if not html:
-                self.logger.warning(f"Could not get page source for {game_link}")
-                return None
-            
-            # Parse individual stats using BeautifulSoup (like altscraper.py)
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # Find all stat tables (one for each team)
-            stat_tables = soup.find_all('table', id=re.compile(r'competitor_\d+_year_stat_category_0_data_table'))
-            
-            if len(stat_tables) < 2:
-                error_msg = f"Could not find both team stat tables for {game_link}"
-                self.logger.warning(error_msg)
-                self.send_notification(
-                    error_msg,
-                    ErrorType.GAME_ERROR,
-                    division=division,
-                    date=f"{year}-{month}-{day}",
-                    gender=gender,
-                    game_link=game_link
-                )
-                return None
-            
-            all_players = []
-            
-            # Extract team names from card headers
-            team_names = []
-            for table in stat_tables:
-                # Find the parent card element
-                card = table.find_parent('div', class_='card')
-                if card:
-                    # Find the card header
-                    card_header = card.find('div', class_='card-header')
-                    if card_header:
-                        # Find the team name link in the header (look for link with target="TEAM_WIN" or href starting with /teams/)
-                        team_link = None
-                        # First try to find link with target="TEAM_WIN"
-                        team_link = card_header.find('a', {'target': 'TEAM_WIN'})
-                        if not team_link:
-                            # Fallback: find link with href starting with /teams/
-                            all_links = card_header.find_all('a', class_='skipMask')
-                            for link in all_links:
-                                href = link.get('href', '')
-                                if href and href.startswith('/teams/'):
-                                    team_link = link
-                                    break
-                        
-                        if team_link:
-                            team_name = team_link.get_text(strip=True)
-                            team_names.append(team_name)
-                        else:
-                            # Fallback: try to find any text in the header (excluding "Period Stats")
-                            header_text = card_header.get_text(strip=True)
-                            # Remove "Period Stats" if present
-                            if 'Period Stats' in header_text:
-                                header_text = header_text.replace('Period Stats', '').strip()
-                            if header_text:
-                                team_names.append(header_text)
-                            else:
-                                team_names.append(None)
-                    else:
-                        team_names.append(None)
-                else:
-                    team_names.append(None)
-            
-            # Ensure we have two team names
-            if len(team_names) < 2 or team_names[0] is None or team_names[1] is None:
-                self.logger.warning(f"Could not extract team names properly for {game_link}, using fallback")
-                team1_name = "Team 1"
-                team2_name = "Team 2"
-            else:
-                team1_name = team_names[0]
-                team2_name = team_names[1]
-            
-            for table_idx, table in enumerate(stat_tables):
-                team_name = team1_name if table_idx == 0 else team2_name
-                opponent_name = team2_name if table_idx == 0 else team1_name
-                
-                # Find all player rows
-                tbody = table.find('tbody')
-                if not tbody:
-                    continue
-                    
-                player_rows = tbody.find_all('tr', id=re.compile(r'game_player_\d+_year_stat_category_0'))
-                
-                # Skip the last row (usually team totals/team name row)
-                if len(player_rows) > 0:
-                    player_rows = player_rows[:-1]
                 
-                for row in player_rows:
-                    try:
-                        # Skip team totals rows
-                        if 'TEAM' in row.get_text() or team_name.strip() in row.get_text():
-                            continue
-                        
-                        cells = row.find_all('td')
-                        if len(cells) < 20:
-                            continue
-                        
-                        # Extract player data (same as altscraper.py)
-                        player_num = cells[0].get_text(strip=True) if len(cells) > 0 else ''
-                        
-                        name_elem = cells[1].find('a')
-                        player_name = name_elem.get_text(strip=True) if name_elem else cells[1].get_text(strip=True)
-                        
-                        # Extract player ID from href (e.g., /players/10804376 -> 10804376)
-                        player_id = ''
-                        if name_elem and name_elem.get('href'):
-                            href = name_elem.get('href')
-                            # Extract the ID from the href (last part after /players/)
-                            if '/players/' in href:
-                                player_id = href.split('/players/')[-1].split('/')[0].split('?')[0]
-                        
-                        position = cells[2].get_text(strip=True) if len(cells) > 2 else ''
-                        
-                        # Convert minutes from "MM:SS" to decimal
-                        min_text = cells[3].get_text(strip=True) if len(cells) > 3 else '0:00'
-                        minutes = self._convert_minutes_to_decimal(min_text)
-                        
-                        fgm = cells[4].get_text(strip=True) if len(cells) > 4 else '0'
-                        fga = cells[5].get_text(strip=True) if len(cells) > 5 else '0'
-                        fgm_a = f"{fgm}-{fga}"
-                        
-                        fg3m = cells[6].get_text(strip=True) if len(cells) > 6 else '0'
-                        fg3a = cells[7].get_text(strip=True) if len(cells) > 7 else '0'
-                        fg3m_a = f"{fg3m}-{fg3a}"
-                        
-                        ftm = cells[8].get_text(strip=True) if len(cells) > 8 else '0'
-                        fta = cells[9].get_text(strip=True) if len(cells) > 9 else '0'
-                        ftm_a = f"{ftm}-{fta}"
-                        
-                        pts = cells[10].get_text(strip=True) if len(cells) > 10 else '0'
-                        oreb = cells[11].get_text(strip=True) if len(cells) > 11 else '0'
-                        dreb = cells[12].get_text(strip=True) if len(cells) > 12 else '0'
-                        reb = cells[13].get_text(strip=True) if len(cells) > 13 else '0'
-                        ast = cells[14].get_text(strip=True) if len(cells) > 14 else '0'
-                        to = cells[15].get_text(strip=True) if len(cells) > 15 else '0'
-                        stl = cells[16].get_text(strip=True) if len(cells) > 16 else '0'
-                        blk = cells[17].get_text(strip=True) if len(cells) > 17 else '0'
-                        pf = cells[18].get_text(strip=True) if len(cells) > 18 else '0'
-                        
-                        # Create player record as DataFrame row
-                        player_dict = {
-                            'NO': player_num,
-                            'Name': player_name,
-                            'PlayerID': player_id,
-                            'POS': position,
-                            'MIN': minutes,
-                            'FGM-A': fgm_a,
-                            '3PM-A': fg3m_a,
-                            'FTM-A': ftm_a,
-                            'OREB': oreb,
-                            'REB': reb,
-                            'AST': ast,
-                            'ST': stl,
-                            'BLK': blk,
-                            'TO': to,
-                            'PF': pf,
-                            'PTS': pts,
-                            'Unnamed: 15': '',
-                            'TEAM': team_name,
-                            'OPP': opponent_name,
-                            'GAMEID': game_id,
-                            'GAMELINK': game_link,
-                        }
-                        
-                        all_players.append(player_dict)
-                        
-                    except Exception as e:
-                        self.logger.warning(f"Error parsing player row: {e}")
-                        continue
-            
-            if not all_players:
-                self.logger.warning(f"No player data found for {game_link}")
-                return None
-            
-            # Convert to DataFrame
-            df = pd.DataFrame(all_players)
-            
-            # Split into two teams
-            team1_df = df[df['TEAM'] == team1_name].copy()
-            team2_df = df[df['TEAM'] == team2_name].copy()
-            
-            if team1_df.empty or team2_df.empty:
-                self.logger.warning(f"Could not split teams properly for {game_link}")
-                return None
-            
-            # Create TeamData objects
-            team_one_data = TeamData(
-                team_name=team1_name,
-                opponent_name=team2_name,
-                game_id=game_id,
-                game_link=game_link,
-                stats=team1_df[['NO', 'Name', 'PlayerID', 'POS', 'MIN', 'FGM-A', '3PM-A', 'FTM-A', 'OREB', 'REB', 'AST', 'ST', 'BLK', 'TO', 'PF', 'PTS', 'Unnamed: 15']]
-            )
-            
-            team_two_data = TeamData(
-                team_name=team2_name,
-                opponent_name=team1_name,
-                game_id=game_id,
-                game_link=game_link,
-                stats=team2_df[['NO', 'Name', 'PlayerID', 'POS', 'MIN', 'FGM-A', '3PM-A', 'FTM-A', 'OREB', 'REB', 'AST', 'ST', 'BLK', 'TO', 'PF', 'PTS', 'Unnamed: 15']]
-            )
+                if self.use_cache:
+                    self.game_cache.put_teams(game_link, *teams)
+            team_one_data, team_two_data = teams
             
             # Check if this is a cross-division duplicate
             # Use mapping flag if provided (for parallel scraping), otherwise use visited_links
@@ -1025,35 +1072,21 @@ class NCAAScraper(BaseScraper):
             )
             
             # Save to CSV
-            if self.save_game_data(game_data, csv_path):
+            with self.phase_timer.time("save"):
+                saved = self.save_game_data(game_data, csv_path)
+            if saved:
                 self.logger.info(f"Successfully saved game data for {game_id}")
+                if existing_ids is not None:
+                    existing_ids.add(game_id)
                 return game_data
             else:
                 self.logger.error(f"Failed to save game data for {game_id}")
                 return None
                 
         except Exception as e:
-            error_str = str(e)
-            if "HTTPConnectionPool" in error_str or "Read timed out" in error_str:
+            if SeleniumUtils.is_driver_unresponsive(e):
                 self.logger.error(f"Driver frozen/unresponsive during game scrape for {game_link}: {e}")
-                try:
-                    SeleniumUtils._cleanup_driver_resources()
-                    SeleniumUtils.safe_quit_driver(self.driver)
-                except Exception as e2:
-                    self.logger.warning(f"Error during cleanup: {e2}")
-                
-                time.sleep(5)
-                
-                try:
-                    self.driver = SeleniumUtils.create_driver(headless=True, max_retries=3)
-                except Exception as e2:
-                    self.logger.error(f"Failed to recreate driver: {e2}")
-                    SeleniumUtils._cleanup_driver_resources()
-                    time.sleep(10)
-                    try:
-                        self.driver = SeleniumUtils.create_driver(headless=True, max_retries=3)
-                    except Exception as e3:
-                        self.logger.error(f"Failed to recreate driver after extended wait: {e3}")
+                self._recover_frozen_driver()
                 return None
             else:
                 error_msg = f"Error scraping game {game_link}: {e}"
@@ -1068,8 +1101,404 @@ class NCAAScraper(BaseScraper):
                 )
                 return None
     
-    def _convert_minutes_to_decimal(self, min_text: str) -> float:
+    def _recover_frozen_driver(self) -> bool:
+        """
+        Get the calling thread's driver working again after a command froze.
+        
+        A slow page usually only needs its load stopped, so the browser is reset in
+        place and only recreated if it doesn't respond (e.g. its session is gone).
+        Pooled drivers are rebuilt by the pool in the background instead.
+        
+        Returns:
+            True if the thread has a usable driver, False otherwise
+        """
+        if self.driver is not None and SeleniumUtils.soft_reset_driver(self.driver):
+            self.logger.info("Recovered frozen driver without restarting it")
+            return True
+        
+        pool = getattr(self._local, 'pool', None)
+        if pool is not None and self._local.borrowed:
+            # Let the pool restart Chrome in the background and carry on with another driver
+            pool.replace_async(self.driver)
+            self.driver = None
+            self._local.borrowed = False
+            try:
+                self._ensure_driver()
+                return True
+            except Exception as e:
+                self.logger.error(f"Failed to borrow a replacement driver: {e}")
+                return False
+        
+        try:
+            # Quitting waits for this driver's own Chrome to exit and kills it if it hangs on
+            SeleniumUtils.safe_quit_driver(self.driver)
+            # Only sweeps leftover Chrome once no other driver is alive
+            SeleniumUtils._cleanup_driver_resources()
+        except Exception as e:
+            self.logger.warning(f"Error during cleanup: {e}")
+        
+        try:
+            self.driver = SeleniumUtils.create_driver(headless=True, max_retries=3)
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to recreate driver: {e}")
+            self.driver = None
+            return False
+    
+    def _try_http_game_html(self, game_link: str) -> Optional[str]:
+        """
+        Fetch a game's individual stats page with a plain HTTP request, bypassing Selenium.
+        
+        Args:
+            game_link: Game link to fetch
+        
+        Returns:
+            Page HTML containing both teams' stat tables, or None if the page could not
+            be fetched or needs rendering (callers should fall back to the Selenium path)
+        """
+        try:
+            self.rate_limiter.acquire(game_link)
+            response = self._http_session().get(game_link, timeout=HTTP_TIMEOUT)
+            if response.status_code != 200:
+                self.logger.info(f"HTTP fetch of {game_link} returned {response.status_code}, falling back to Selenium")
+                return None
+            
+            html = response.text
+            if len(set(STAT_TABLE_ID_PATTERN.findall(html))) < 2:
+                self.logger.info(f"No stat tables in HTTP response for {game_link}, falling back to Selenium")
+                return None
+            
+            return html
+            
+        except requests.RequestException as e:
+            self.logger.info(f"HTTP fetch of {game_link} failed ({e}), falling back to Selenium")
+            return None
+    
+    def _load_game_html_with_selenium(self, game_link: str) -> Optional[str]:
+        """
+        Load a game's individual stats page in the calling thread's driver.
+        
+        Args:
+            game_link: Game link to load
+        
+        Returns:
+            Page HTML, or None if the page could not be loaded
+        
+        Raises:
+            Exception: If the driver fails in a way the caller must recover from
+        """
+        # Navigate to individual stats page with timeout handling
+        self._ensure_driver()
+        try:
+            self.rate_limiter.acquire(game_link)
+            load_success = SeleniumUtils.safe_driver_operation(
+                self.driver,
+                lambda: self.driver.get(game_link) or True,
+                timeout=90,
+                operation_name=f"load individual stats page {game_link}"
+            )
+            
+            if load_success is None:
+                self.logger.warning(f"Page load hung for game {game_link}, attempting recovery...")
+                if not self._stop_page_load():
+                    self.logger.error(f"Driver unresponsive for {game_link}, skipping...")
+                    return None
+            else:
+                self.logger.info(f"Successfully navigated to: {game_link}")
+                
+        except TimeoutException:
+            self.logger.warning(f"Page load timeout for game {game_link}, attempting recovery...")
+            if not self._stop_page_load():
+                self.logger.error(f"Driver unresponsive for {game_link}, skipping...")
+                return None
+        except Exception as e:
+            if SeleniumUtils.is_driver_unresponsive(e):
+                self.logger.error(f"Driver frozen/unresponsive during page load for {game_link}: {e}")
+                self._recover_frozen_driver()
+                return None
+            else:
+                raise
+        
+        # Wait for both teams' stat tables; they are rendered together, so no team switch is needed
+        try:
+            SeleniumUtils.wait_with_reloads(
+                self.driver,
+                lambda driver: len(driver.find_elements(*STAT_TABLE_LOCATOR)) >= 2,
+                self.config.wait_timeout
+            )
+            self.logger.debug(f"Stat tables found in DOM for {game_link}")
+        except TimeoutException:
+            self.logger.warning(f"Stat tables not found in DOM for {game_link} after waiting, page may not be loaded properly")
+            # Still try to get page source in case tables are there but selector didn't match
+        
+        # Get page source for parsing
+        html = SeleniumUtils.safe_driver_operation(
+            self.driver,
+            lambda: self.driver.page_source,
+            timeout=30,
+            default_return="",
+            operation_name="get page source for parsing"
+        )
+        
+        if not html:
+            self.logger.warning(f"Could not get page source for {game_link}")
+            return None
+        
+        # The browser got through; let this thread's plain HTTP fetches reuse its cookies
+        self._share_driver_cookies()
+        
+        return html
+    
+    def _share_driver_cookies(self):
+        """Copy the calling thread's browser cookies into its HTTP session."""
+        try:
+            cookies = SeleniumUtils.safe_driver_operation(
+                self.driver,
+                lambda: self.driver.get_cookies(),
+                timeout=5,
+                default_return=[],
+                operation_name="read browser cookies"
+            )
+            jar = self._http_session().cookies
+            for cookie in cookies or []:
+                jar.set(cookie['name'], cookie['value'], domain=cookie.get('domain', ''), path=cookie.get('path', '/'))
+        except Exception as e:
+            self.logger.debug(f"Could not copy browser cookies to HTTP session: {e}")
+    
+    def _parse_game_page(self, html: str, game_id: str, game_link: str) -> Optional[Tuple[TeamData, TeamData]]:
+        """
+        Parse a game page, reusing an earlier parse if its stat tables are identical.
+        
+        NCAA sometimes serves the same box score under several game IDs. Those pages
+        differ only outside the stat tables, so a digest of the tables identifies them
+        without parsing the HTML again.
+        
+        Args:
+            html: Individual stats page HTML
+            game_id: Game ID
+            game_link: Game link
+        
+        Returns:
+            Tuple of (team one, team two) data, or None if the page couldn't be parsed
+        """
+        digest = self._stat_tables_digest(html)
+        if digest is not None:
+            with self._digest_lock:
+                seen = self._parsed_by_digest.get(digest)
+            if seen is not None:
+                self.logger.info(f"Stats for {game_link} match an already parsed page ({seen[0].game_link}), reusing them")
+                return tuple(replace(team, game_id=game_id, game_link=game_link) for team in seen)
+        
+        teams = self._parse_individual_stats(html, game_id, game_link)
+        if teams is not None and digest is not None:
+            with self._digest_lock:
+                self._parsed_by_digest[digest] = teams
+        return teams
+    
+    @staticmethod
+    def _stat_tables_digest(html: str) -> Optional[str]:
+        """Digest of the HTML spanning both teams' stat tables (None if they aren't on the page)."""
+        first = html.find(STAT_TABLE_ID_MARKER)
+        last = html.rfind(STAT_TABLE_ID_MARKER)
+        if first == -1 or first == last:
+            return None
+        
+        start = html.rfind('<table', 0, first)
+        end = html.find('</table>', last)
+        if start == -1 or end == -1:
+            return None
+        
+        # Contest IDs in links are the only part of the tables that differs between copies
+        tables = CONTEST_ID_PATTERN.sub('/contests/', html[start:end])
+        return hashlib.blake2b(tables.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _parse_individual_stats(self, html: str, game_id: str, game_link: str) -> Optional[Tuple[TeamData, TeamData]]:
+        """
+        Parse both teams' player stats out of an individual_stats page.
+        
+        Both teams' tables are in the same HTML, so one pass reads the whole game.
+        
+        Args:
+            html: Individual stats page HTML
+            game_id: Game ID
+            game_link: Game link
+        
+        Returns:
+            Tuple of (team one, team two) data, or None if the page couldn't be parsed
+        """
+        tree = lxml.html.fromstring(html)
+        
+        # Find all stat tables (one for each team)
+        stat_tables = [
+            table for table in STAT_TABLES_XPATH(tree)
+            if STAT_TABLE_ID_PATTERN.search(table.get('id', ''))
+        ]
+        
+        if len(stat_tables) < 2:
+            self.logger.warning(f"Could not find both team stat tables for {game_link}")
+            return None
+        
+        # Extract team names from card headers
+        team_names = []
+        for table in stat_tables:
+            # Find the parent card element
+            cards = CARD_XPATH(table)
+            if cards:
+                # Find the card header
+                card_headers = CARD_HEADER_XPATH(cards[0])
+                if card_headers:
+                    card_header = card_headers[0]
+                    # Find the team name link in the header (look for link with target="TEAM_WIN" or href starting with /teams/)
+                    team_link = None
+                    # First try to find link with target="TEAM_WIN"
+                    team_links = card_header.xpath(".//a[@target='TEAM_WIN']")
+                    if team_links:
+                        team_link = team_links[0]
+                    else:
+                        # Fallback: find link with href starting with /teams/
+                        team_links = card_header.xpath(".//a[starts-with(@href, '/teams/')][contains(concat(' ', normalize-space(@class), ' '), ' skipMask ')]")
+                        if team_links:
+                            team_link = team_links[0]
+                    
+                    if team_link is not None:
+                        team_name = self._stripped_text(team_link)
+                        team_names.append(team_name)
+                    else:
+                        # Fallback: try to find any text in the header (excluding "Period Stats")
+                        header_text = self._stripped_text(card_header)
+                        # Remove "Period Stats" if present
+                        if 'Period Stats' in header_text:
+                            header_text = header_text.replace('Period Stats', '').strip()
+                        if header_text:
+                            team_names.append(header_text)
+                        else:
+                            team_names.append(None)
+                else:
+                    team_names.append(None)
+            else:
+                team_names.append(None)
+        
+        # Ensure we have two team names
+        if len(team_names) < 2 or team_names[0] is None or team_names[1] is None:
+            self.logger.warning(f"Could not extract team names properly for {game_link}, using fallback")
+            team1_name = "Team 1"
+            team2_name = "Team 2"
+        else:
+            team1_name = team_names[0]
+            team2_name = team_names[1]
+        
+        # Raw cell text per player, one list per team; columns are built in bulk afterwards
+        team_rows: List[List[list]] = [[], []]
+        for table_idx, table in enumerate(stat_tables):
+            team_name = team1_name if table_idx == 0 else team2_name
+            rows = team_rows[0 if table_idx == 0 else 1]
+            
+            # Find all player rows
+            tbodies = table.xpath('.//tbody')
+            if not tbodies:
+                continue
+                
+            player_rows = [
+                row for row in PLAYER_ROWS_XPATH(tbodies[0])
+                if PLAYER_ROW_ID_PATTERN.search(row.get('id', ''))
+            ]
+            
+            # Skip the last row (usually team totals/team name row)
+            if len(player_rows) > 0:
+                player_rows = player_rows[:-1]
+            
+            for row in player_rows:
+                try:
+                    # Skip team totals rows
+                    row_text = row.text_content()
+                    if 'TEAM' in row_text or team_name.strip() in row_text:
+                        continue
+                    
+                    cell_elems = CELLS_XPATH(row)
+                    cells = [self._stripped_text(cell) for cell in cell_elems]
+                    if len(cells) < 20:
+                        continue
+                    
+                    name_elems = cell_elems[1].xpath('.//a')
+                    name_elem = name_elems[0] if name_elems else None
+                    player_name = self._stripped_text(name_elem) if name_elem is not None else cells[1]
+                    
+                    # Extract player ID from href (e.g., /players/10804376 -> 10804376)
+                    player_id = ''
+                    if name_elem is not None and name_elem.get('href'):
+                        href = name_elem.get('href')
+                        # Extract the ID from the href (last part after /players/)
+                        if '/players/' in href:
+                            player_id = href.split('/players/')[-1].split('/')[0].split('?')[0]
+                    
+                    rows.append([cells[0], player_name, player_id, cells[2], *cells[3:19]])
+                    
+                except Exception as e:
+                    self.logger.warning(f"Error parsing player row: {e}")
+                    continue
+        
+        if not any(team_rows):
+            self.logger.warning(f"No player data found for {game_link}")
+            return None
+        
+        if not all(team_rows):
+            self.logger.warning(f"Could not split teams properly for {game_link}")
+            return None
+        
+        # Create TeamData objects
+        team_one_data = TeamData(
+            team_name=team1_name,
+            opponent_name=team2_name,
+            game_id=game_id,
+            game_link=game_link,
+            stats=self._player_stats_frame(team_rows[0])
+        )
+        
+        team_two_data = TeamData(
+            team_name=team2_name,
+            opponent_name=team1_name,
+            game_id=game_id,
+            game_link=game_link,
+            stats=self._player_stats_frame(team_rows[1])
+        )
+        
+        return team_one_data, team_two_data
+    
+    @classmethod
+    def _player_stats_frame(cls, rows: List[list]) -> pd.DataFrame:
+        """
+        Build a team's stats DataFrame from raw player cells with whole-column operations.
+        
+        Args:
+            rows: Per player, [NO, Name, PlayerID, POS] followed by the 16 stat cells (MIN through PF)
+        
+        Returns:
+            DataFrame with the box score columns written to the CSV
+        """
+        raw = pd.DataFrame(rows, columns=RAW_PLAYER_COLUMNS)
+        stats = raw[['NO', 'Name', 'PlayerID', 'POS']].copy()
+        stats['MIN'] = [cls._convert_minutes_to_decimal(min_text) for min_text in raw['MIN']]
+        stats['FGM-A'] = raw['FGM'] + '-' + raw['FGA']
+        stats['3PM-A'] = raw['3PM'] + '-' + raw['3PA']
+        stats['FTM-A'] = raw['FTM'] + '-' + raw['FTA']
+        for column in ('OREB', 'REB', 'AST', 'ST', 'BLK', 'TO', 'PF', 'PTS'):
+            stats[column] = raw[column]
+        stats['Unnamed: 15'] = ''
+        return stats
+    
+    @staticmethod
+    def _stripped_text(element) -> str:
+        """Text of an lxml element with each text node stripped, like BeautifulSoup's get_text(strip=True)."""
+        return ''.join(text.strip() for text in element.itertext())
+    
+    @staticmethod
+    def _convert_minutes_to_decimal(min_text: str) -> float:
         """Convert minutes from 'MM:SS' format to decimal (e.g., '31:36' -> 31.6)."""
+        # Fast path for well-formed 'MM:SS', which is nearly every row
+        minutes, sep, seconds = min_text.partition(':')
+        if sep and minutes.isdecimal() and seconds.isdecimal():
+            return round(int(minutes) + int(seconds) / 60, 1)
+        
         try:
             if ':' in min_text:
                 parts = min_text.split(':')
@@ -1085,9 +1514,8 @@ class NCAAScraper(BaseScraper):
     def _extract_team_names(self, team_selector) -> List[str]:
         """Extract team names from the team selector."""
         try:
-            child_divs = team_selector.find_elements(By.TAG_NAME, "div")
-            team_names = [div.text.strip() for div in child_divs if div.text.strip()]
-            return team_names
+            # One script call instead of a WebDriver round trip per div
+            return self.driver.execute_script(TEAM_NAMES_SCRIPT, team_selector) or []
         except Exception as e:
             self.logger.error(f"Error extracting team names: {e}")
             return []
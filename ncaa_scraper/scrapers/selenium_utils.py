@@ -5,7 +5,11 @@ import logging
 import os
 import shutil
 import random
-from typing import List, Optional
+import socket
+import subprocess
+import threading
+import urllib3
+from typing import List, Optional, Set
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -15,20 +19,53 @@ from selenium.webdriver.chrome.service import Service
 from selenium.common.exceptions import TimeoutException, WebDriverException, SessionNotCreatedException
 from webdriver_manager.chrome import ChromeDriverManager
 
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
 logger = logging.getLogger(__name__)
 
+# Subresources that are never needed to read scoreboard/box score HTML
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.css', '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*.mp4', '*.webm', '*.mp3',
+    '*doubleclick*', '*googletagmanager*', '*google-analytics*',
+]
+
+# Page loads may take up to PAGE_LOAD_TIMEOUT; any WebDriver command outliving
+# COMMAND_TIMEOUT means chromedriver itself is frozen
+PAGE_LOAD_TIMEOUT = 60
+COMMAND_TIMEOUT = 75
+
+# Explicit waits re-check their condition this often (Selenium's default is 0.5s)
+WAIT_POLL_FREQUENCY = 0.1
+
+# wait_with_reloads never reloads a page that has had less than this long to load
+MIN_RELOAD_WINDOW = 5
+
+# Upper bound for each of Chrome's disk and media caches
+CHROME_CACHE_BYTES = 32 * 1024 * 1024
+
 
 class SeleniumUtils:
     """Utility class for Selenium operations."""
     
+    # IDs of drivers created here and not yet quit (drivers may run concurrently)
+    _active_drivers: Set[int] = set()
+    _active_lock = threading.Lock()
+    
     @staticmethod
-    def create_driver(headless: bool = False, max_retries: int = 3) -> webdriver.Chrome:
+    def create_driver(headless: bool = False, max_retries: int = 3, block_resources: bool = True) -> webdriver.Chrome:
         """
         Create and configure Chrome WebDriver with retry logic.
         
         Args:
             headless: Whether to run in headless mode
             max_retries: Maximum number of retry attempts
+            block_resources: Block images, stylesheets, fonts and trackers (pages are
+                only read through their HTML, so these are never needed)
         
         Returns:
             Configured Chrome WebDriver
@@ -60,11 +97,11 @@ class SeleniumUtils:
                 options.add_argument("--disable-extensions")
                 options.add_argument("--disable-plugins")
                 options.add_argument("--disable-web-security")
-                options.add_argument("--disable-features=VizDisplayCompositor")
+                # Chrome only honours the last --disable-features switch, so list them all in one
+                options.add_argument("--disable-features=VizDisplayCompositor,TranslateUI")
                 options.add_argument("--ignore-certificate-errors")
                 options.add_argument("--ignore-ssl-errors")
                 options.add_argument("--allow-running-insecure-content")
-                options.add_argument("--remote-debugging-port=9222")
                 options.add_argument("--disable-blink-features=AutomationControlled")
                 options.add_argument("--disable-logging")
                 options.add_argument("--disable-default-apps")
@@ -77,7 +114,6 @@ class SeleniumUtils:
                 options.add_argument("--disable-client-side-phishing-detection")
                 options.add_argument("--disable-component-update")
                 options.add_argument("--disable-domain-reliability")
-                options.add_argument("--disable-features=TranslateUI")
                 options.add_argument("--disable-ipc-flooding-protection")
                 
                 # Memory and performance optimizations to prevent hangs
@@ -87,12 +123,22 @@ class SeleniumUtils:
                 options.add_argument("--disable-background-timer-throttling")
                 options.add_argument("--disable-breakpad")
                 options.add_argument("--disable-hang-monitor")
+                # Cap Chrome's caches so long runs don't keep growing the browser's memory
+                options.add_argument(f"--disk-cache-size={CHROME_CACHE_BYTES}")
+                options.add_argument(f"--media-cache-size={CHROME_CACHE_BYTES}")
+                options.add_argument("--aggressive-cache-discard")
                 options.add_argument("--disable-prompt-on-repost")
                 options.add_argument("--disable-renderer-backgrounding")
                 options.add_argument("--force-color-profile=srgb")
                 options.add_argument("--metrics-recording-only")
                 options.add_argument("--enable-automation")
                 
+                # Only the DOM is scraped: return from get() at DOMContentLoaded and skip images
+                options.page_load_strategy = 'eager'
+                options.add_argument("--blink-settings=imagesEnabled=false")
+                options.add_argument("--disable-popup-blocking")
+                options.add_argument("--disable-notifications")
+                
                 # Anti-detection measures
                 options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
                 options.add_argument("--accept-language=en-US,en;q=0.9")
@@ -118,7 +164,7 @@ class SeleniumUtils:
                         "media_stream": 2,
                     },
                     "profile.managed_default_content_settings": {
-                        "images": 1
+                        "images": 2
                     }
                 }
                 options.add_experimental_option("prefs", prefs)
@@ -149,10 +195,12 @@ class SeleniumUtils:
                     service = Service(ChromeDriverManager().install())
                 
                 # Create driver
-                driver = webdriver.Chrome(service=service, options=options)
+                driver = webdriver.Chrome(service=service, options=options, keep_alive=True)
+                SeleniumUtils._widen_command_pool(driver)
+                SeleniumUtils._set_command_timeout(driver, COMMAND_TIMEOUT)
                 
                 # Set timeouts to prevent infinite hangs
-                driver.set_page_load_timeout(60)  # Max 60 seconds for page load
+                driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)  # Max 60 seconds for page load
                 driver.set_script_timeout(30)     # Max 30 seconds for scripts
                 
                 # Execute anti-detection scripts
@@ -168,6 +216,9 @@ class SeleniumUtils:
                     logger.warning(f"Error setting anti-detection properties: {e}")
                     # Continue anyway - these are nice-to-have
                 
+                if block_resources:
+                    SeleniumUtils.block_unneeded_resources(driver)
+                
                 # Test the driver
                 try:
                     driver.get("about:blank")
@@ -176,6 +227,9 @@ class SeleniumUtils:
                     logger.warning(f"Driver test failed: {e}")
                     # Continue anyway - driver might still work
                 
+                with SeleniumUtils._active_lock:
+                    SeleniumUtils._active_drivers.add(id(driver))
+                
                 logger.info("Chrome driver created successfully")
                 return driver
                 
@@ -199,9 +253,131 @@ class SeleniumUtils:
                     logger.error(f"Failed to create Chrome driver after {max_retries} attempts")
                     raise SessionNotCreatedException(f"Failed to create Chrome driver: {e}")
     
+    @staticmethod
+    def block_unneeded_resources(driver: webdriver.Chrome) -> bool:
+        """
+        Block subresources that scraping never uses via the Chrome DevTools Protocol.
+        
+        Args:
+            driver: Chrome WebDriver instance
+        
+        Returns:
+            True if the block list was applied, False otherwise
+        """
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+            return True
+        except Exception as e:
+            logger.warning(f"Could not block page resources: {e}")
+            return False
+    
+    @staticmethod
+    def soft_reset_driver(driver: webdriver.Chrome, timeout: float = 5) -> bool:
+        """
+        Stop a stuck page load and free the page's JavaScript memory without restarting Chrome.
+        
+        Args:
+            driver: Chrome WebDriver instance
+            timeout: Maximum time to wait for Chrome to respond
+        
+        Returns:
+            True if the driver responded, False if it must be recreated
+        """
+        def reset():
+            driver.execute_cdp_cmd('Page.stopLoading', {})
+            driver.execute_cdp_cmd('Memory.forciblyPurgeJavaScriptMemory', {})
+            return True
+        
+        try:
+            return bool(SeleniumUtils.safe_driver_operation(
+                driver, reset, timeout=timeout, default_return=False, operation_name="soft reset driver"
+            ))
+        except Exception as e:
+            logger.warning(f"Could not reset driver in place: {e}")
+            return False
+    
+    @staticmethod
+    def purge_browser_memory(driver: webdriver.Chrome, timeout: float = 5) -> bool:
+        """
+        Drop Chrome's HTTP cache and garbage collect JavaScript memory.
+        
+        Args:
+            driver: Chrome WebDriver instance
+            timeout: Maximum time to wait for Chrome to respond
+        
+        Returns:
+            True if the caches were purged, False otherwise
+        """
+        def purge():
+            driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+            driver.execute_cdp_cmd('Memory.forciblyPurgeJavaScriptMemory', {})
+            return True
+        
+        try:
+            return bool(SeleniumUtils.safe_driver_operation(
+                driver, purge, timeout=timeout, default_return=False, operation_name="purge browser memory"
+            ))
+        except Exception as e:
+            logger.warning(f"Could not purge browser memory: {e}")
+            return False
+    
+    @staticmethod
+    def _widen_command_pool(driver: webdriver.Chrome, maxsize: int = 10):
+        """
+        Enlarge the keep-alive connection pool used for WebDriver commands.
+        
+        Selenium's pool holds a single connection to chromedriver, so overlapping
+        commands (e.g. from safe_driver_operation threads) open and discard a new
+        TCP connection each time.
+        
+        Args:
+            driver: WebDriver instance
+            maxsize: Number of connections to keep alive
+        """
+        try:
+            conn = getattr(driver.command_executor, '_conn', None)
+            if isinstance(conn, urllib3.PoolManager):
+                conn.connection_pool_kw.update(maxsize=maxsize, block=False)
+                conn.clear()
+        except Exception as e:
+            logger.debug(f"Could not resize WebDriver connection pool: {e}")
+    
+    @staticmethod
+    def _set_command_timeout(driver: webdriver.Chrome, timeout: float):
+        """
+        Bound every WebDriver command with one HTTP read timeout.
+        
+        Selenium otherwise waits up to 120s on a frozen chromedriver for each
+        command; with this, the first stuck command fails fast instead.
+        
+        Args:
+            driver: WebDriver instance
+            timeout: Seconds to wait for chromedriver to answer a command
+        """
+        try:
+            executor = driver.command_executor
+            client_config = getattr(executor, '_client_config', None)
+            if client_config is not None:
+                # Newer Selenium passes this timeout with every request
+                client_config.timeout = timeout
+            conn = getattr(executor, '_conn', None)
+            if isinstance(conn, urllib3.PoolManager):
+                # Older Selenium reads the timeout from the connection pool
+                conn.connection_pool_kw.update(timeout=timeout)
+                conn.clear()
+        except Exception as e:
+            logger.debug(f"Could not set WebDriver command timeout: {e}")
+    
     @staticmethod
     def _cleanup_driver_resources():
         """Clean up driver-related resources and processes."""
+        with SeleniumUtils._active_lock:
+            if SeleniumUtils._active_drivers:
+                # Killing Chrome now would take down drivers still in use by other workers
+                logger.debug(f"Skipping driver cleanup: {len(SeleniumUtils._active_drivers)} driver(s) still active")
+                return
+        
         try:
             # Kill any existing Chrome processes FIRST (before trying to quit driver)
             if os.name == 'nt':  # Windows
@@ -213,7 +389,10 @@ class SeleniumUtils:
             else:  # Unix-like systems
                 os.system('pkill -9 -f chrome 2>/dev/null')
                 os.system('pkill -9 -f chromedriver 2>/dev/null')
-                time.sleep(2)
+                # Wait until the killed processes are actually gone (at most 2s)
+                deadline = time.time() + 2
+                while time.time() < deadline and os.system('pgrep -f chrome >/dev/null 2>&1') == 0:
+                    time.sleep(0.05)
             
             # Clean up temporary directories
             temp_dirs = ["/tmp/chrome-session", "chrome-session"]
@@ -233,6 +412,86 @@ class SeleniumUtils:
         delay = random.uniform(min_seconds, max_seconds)
         time.sleep(delay)
     
+    @staticmethod
+    def wait_ready(driver: webdriver.Chrome, timeout: float = 3.0, poll: float = 0.1) -> bool:
+        """
+        Poll until the current document has been parsed, instead of sleeping a fixed time.
+        
+        Args:
+            driver: WebDriver instance
+            timeout: Maximum time to wait in seconds
+            poll: Interval between readyState checks in seconds
+        
+        Returns:
+            True if the document became ready within the timeout, False otherwise
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                # 'interactive' is enough: pages load with the eager strategy and only the DOM is read
+                if driver.execute_script("return document.readyState") != 'loading':
+                    return True
+            except Exception:
+                pass
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(poll)
+    
+    @staticmethod
+    def wait_with_reloads(driver: webdriver.Chrome, condition, timeout: float, attempts: int = 3):
+        """
+        Wait for a condition in short, doubling windows, reloading the page between them.
+        
+        A page that loads normally returns within the first window; one whose load
+        broke gets a fresh load instead of running out the whole timeout. Windows
+        are at least MIN_RELOAD_WINDOW long, so a short timeout gets fewer reloads.
+        
+        Args:
+            driver: WebDriver instance
+            condition: Callable taking the driver, as passed to WebDriverWait.until
+            timeout: Total time to wait across all attempts in seconds
+            attempts: Maximum number of windows (the page is reloaded up to attempts - 1 times)
+        
+        Returns:
+            Result of the condition
+        
+        Raises:
+            TimeoutException: If the condition was not met in any window
+        """
+        # Windows grow 1:2:4:... and add up to the timeout (the last one is cut short if needed)
+        first_window = max(timeout / (2 ** attempts - 1), min(MIN_RELOAD_WINDOW, timeout))
+        remaining = timeout
+        for attempt in range(attempts):
+            window = min(first_window * 2 ** attempt, remaining)
+            remaining -= window
+            try:
+                return WebDriverWait(
+                    driver, window, poll_frequency=WAIT_POLL_FREQUENCY
+                ).until(condition)
+            except TimeoutException:
+                if attempt == attempts - 1 or remaining <= 0:
+                    raise
+                logger.info(f"Condition not met after {window:.1f}s, reloading page (attempt {attempt + 2}/{attempts})")
+                SeleniumUtils.safe_driver_operation(
+                    driver, lambda: driver.refresh() or True, timeout=PAGE_LOAD_TIMEOUT, operation_name="reload page"
+                )
+    
+    @staticmethod
+    def is_driver_unresponsive(error: BaseException) -> bool:
+        """
+        Check whether an error means chromedriver stopped answering (frozen or dead).
+        
+        WebDriver commands are HTTP calls to chromedriver, so a hung or crashed
+        driver surfaces as a urllib3 or socket error rather than a WebDriverException.
+        
+        Args:
+            error: Exception raised by a driver operation
+        
+        Returns:
+            True if the driver should be recovered or recreated
+        """
+        return isinstance(error, (urllib3.exceptions.HTTPError, socket.timeout, ConnectionError))
+    
     @staticmethod
     def safe_driver_operation(driver, operation, timeout=10, default_return=None, operation_name="driver operation"):
         """
@@ -281,6 +540,56 @@ class SeleniumUtils:
         else:
             return result[0]
     
+    @staticmethod
+    def _browser_processes(driver: webdriver.Chrome) -> list:
+        """Chrome processes started by a driver's chromedriver (empty if psutil is unavailable)."""
+        if psutil is None:
+            return []
+        
+        process = getattr(getattr(driver, 'service', None), 'process', None)
+        if process is None:
+            return []
+        
+        try:
+            return psutil.Process(process.pid).children(recursive=True)
+        except psutil.Error:
+            return []
+    
+    @staticmethod
+    def _wait_for_service_exit(driver: webdriver.Chrome, browser_processes: Optional[list] = None, timeout: float = 5):
+        """
+        Wait for the chromedriver process behind a quit driver, and its browser, to exit.
+        
+        Callers can then start a new driver straight away instead of sleeping
+        for a fixed time. Processes that outlive the timeout are killed.
+        
+        Args:
+            driver: WebDriver instance that has been quit
+            browser_processes: Chrome processes collected before quitting (see _browser_processes)
+            timeout: Maximum time to wait in seconds
+        """
+        process = getattr(getattr(driver, 'service', None), 'process', None)
+        if process is not None:
+            try:
+                process.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                logger.warning(f"chromedriver (pid {process.pid}) did not exit after {timeout}s, killing it")
+                process.kill()
+            except Exception as e:
+                logger.debug(f"Error waiting for chromedriver to exit: {e}")
+        
+        if browser_processes:
+            try:
+                _, alive = psutil.wait_procs(browser_processes, timeout=timeout)
+                for proc in alive:
+                    logger.warning(f"Chrome process (pid {proc.pid}) did not exit after {timeout}s, killing it")
+                    try:
+                        proc.kill()
+                    except psutil.Error:
+                        pass
+            except Exception as e:
+                logger.debug(f"Error waiting for Chrome to exit: {e}")
+    
     @staticmethod
     def safe_quit_driver(driver: Optional[webdriver.Chrome]) -> bool:
         """
@@ -297,6 +606,9 @@ class SeleniumUtils:
         """
         if not driver:
             return True
+        
+        # Collected up front: once chromedriver exits its children can no longer be found
+        browser_processes = SeleniumUtils._browser_processes(driver)
             
         try:
             # Try to get window handles with timeout protection
@@ -335,6 +647,7 @@ class SeleniumUtils:
                 timeout=10,
                 operation_name="quit driver"
             )
+            SeleniumUtils._wait_for_service_exit(driver, browser_processes)
             logger.info("Driver quit successfully")
             return True
             
@@ -343,9 +656,13 @@ class SeleniumUtils:
             # Try one more time without timeout protection as last resort
             try:
                 driver.quit()
+                SeleniumUtils._wait_for_service_exit(driver, browser_processes)
                 return True
             except Exception:
                 return False
+        finally:
+            with SeleniumUtils._active_lock:
+                SeleniumUtils._active_drivers.discard(id(driver))
     
     @staticmethod
     def wait_for_element(driver: webdriver.Chrome, by: By, value: str, timeout: int = 15) -> Optional[object]:
@@ -362,7 +679,7 @@ class SeleniumUtils:
             WebElement if found, None otherwise
         """
         try:
-            wait = WebDriverWait(driver, timeout)
+            wait = WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY)
             element = wait.until(EC.presence_of_element_located((by, value)))
             return element
         except TimeoutException:
@@ -384,7 +701,7 @@ class SeleniumUtils:
             List of WebElements found
         """
         try:
-            wait = WebDriverWait(driver, timeout)
+            wait = WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY)
             elements = wait.until(EC.presence_of_all_elements_located((by, value)))
             return elements
         except TimeoutException:
@@ -459,7 +776,7 @@ class SeleniumUtils:
         """
         for selector in expected_elements:
             try:
-                wait = WebDriverWait(driver, timeout)
+                wait = WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY)
                 wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
                 return True
             except TimeoutException:
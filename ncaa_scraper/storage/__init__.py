@@ -3,5 +3,7 @@
 from .file_manager import FileManager
 from .google_drive import GoogleDriveManager
 from .csv_handler import CSVHandler
+from .game_cache import GameCache
+from .visited_links import VisitedLinksStore
 
-__all__ = ['FileManager', 'GoogleDriveManager', 'CSVHandler']
+__all__ = ['FileManager', 'GoogleDriveManager', 'CSVHandler', 'GameCache', 'VisitedLinksStore']
@@ -1,9 +1,20 @@
 """CSV handling utilities for the NCAA scraper."""
 
+import atexit
 import os
+import threading
 import pandas as pd
 import logging
-from typing import Optional, Set
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+
+from ..config.constants import CSV_FLUSH_GAMES, CSV_READ_CHUNK_ROWS
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
 
 logger = logging.getLogger(__name__)
 
@@ -11,8 +22,31 @@ logger = logging.getLogger(__name__)
 class CSVHandler:
     """Handles CSV file operations for game data."""
     
-    def __init__(self, file_manager):
+    def __init__(self, file_manager, engine: str = "c"):
         self.file_manager = file_manager
+        # pandas parser for whole-file reads; pyarrow parses large CSVs on several threads
+        if engine == "pyarrow" and pyarrow is None:
+            logger.warning("CSV_ENGINE=pyarrow but pyarrow is not installed, using the C engine")
+            engine = "c"
+        elif engine not in ("c", "pyarrow"):
+            logger.warning(f"Unknown CSV engine {engine!r}, using the C engine")
+            engine = "c"
+        self.engine = engine
+        # Serializes writes when games are scraped by several worker threads
+        self._write_lock = threading.RLock()
+        # Game rows waiting to be appended, per CSV path
+        self._pending: Dict[str, List[pd.DataFrame]] = defaultdict(list)
+        # Appends run on one background thread so disk writes overlap with scraping;
+        # a single worker keeps them in submission order
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="csv-writer")
+        self._write_futures: List[Tuple[str, Future]] = []
+        # CSV paths that lost game data to a failed write; they stay incomplete for this run
+        self._failed_paths: Set[str] = set()
+        # Rows still buffered when the process exits (e.g. a caller that never flushed) are not lost
+        atexit.register(self.close)
+        # Game IDs per CSV path, keyed by the file's (mtime_ns, size) when they were read
+        self._id_cache: Dict[str, Tuple[Tuple[int, int], Set[str]]] = {}
+        self._id_cache_lock = threading.Lock()
     
     def game_exists_in_csv(self, csv_path: str, game_id: str) -> bool:
         """
@@ -25,17 +59,7 @@ class CSVHandler:
         Returns:
             True if game exists, False otherwise
         """
-        if not os.path.exists(csv_path):
-            return False
-        
-        try:
-            df = pd.read_csv(csv_path)
-            if 'GAMEID' in df.columns:
-                return game_id in df['GAMEID'].values
-            return False
-        except Exception as e:
-            logger.warning(f"Error reading CSV file {csv_path}: {e}")
-            return False
+        return str(game_id) in self._cached_game_ids(csv_path)
     
     def append_game_data(self, csv_path: str, game_data_df: pd.DataFrame) -> bool:
         """
@@ -48,15 +72,117 @@ class CSVHandler:
         Returns:
             True if successful, False otherwise
         """
+        with self._write_lock:
+            self._pending[csv_path].append(game_data_df)
+            self._submit_write(csv_path)
+            _, future = self._write_futures[-1]
+            self._drain(csv_path)
+            return future.result()
+    
+    def buffer_game_data(self, csv_path: str, game_data_df: pd.DataFrame) -> bool:
+        """
+        Queue game data for a CSV file, handing it to the background writer once
+        CSV_FLUSH_GAMES games are queued.
+        
+        Args:
+            csv_path: Path to the CSV file
+            game_data_df: DataFrame containing one game's data
+        
+        Returns:
+            True once queued; the rows are only on disk after flush_pending
+            returns True for csv_path
+        """
+        with self._write_lock:
+            self._pending[csv_path].append(game_data_df)
+            if len(self._pending[csv_path]) >= CSV_FLUSH_GAMES:
+                self._submit_write(csv_path)
+            return True
+    
+    def flush_pending(self, csv_path: Optional[str] = None) -> bool:
+        """
+        Append buffered game data to disk and wait for every queued write to finish.
+        
+        Once a write to a file has failed, every later flush of that file fails
+        too, so callers never treat the incomplete file as done (e.g. upload it).
+        
+        Args:
+            csv_path: CSV file to flush (all files if None)
+        
+        Returns:
+            True if every write to the flushed file(s) succeeded, False otherwise
+        """
+        with self._write_lock:
+            self._drain(csv_path)
+            failed = {csv_path} & self._failed_paths if csv_path else self._failed_paths
+            if failed:
+                logger.error(f"Buffered game data could not be written to: {', '.join(sorted(failed))}")
+                return False
+            return True
+    
+    def close(self):
+        """Write any still-buffered game data and stop the background writer (also run at exit)."""
+        with self._write_lock:
+            futures, self._write_futures = self._write_futures, []
+            for path, future in futures:
+                if not future.result():
+                    self._failed_paths.add(path)
+            # Written on this thread: the writer may already refuse new work during interpreter shutdown
+            for path in list(self._pending):
+                if not self._append_frames(path, self._pending.pop(path)):
+                    self._failed_paths.add(path)
+        self._writer.shutdown(wait=True)
+    
+    def _drain(self, csv_path: Optional[str] = None):
+        """Write out buffered game data and wait for queued writes, recording failed paths for flush_pending."""
+        with self._write_lock:
+            for path in ([csv_path] if csv_path else list(self._pending)):
+                self._submit_write(path)
+            futures, self._write_futures = self._write_futures, []
+            # The writer never takes _write_lock, so waiting while holding it is safe
+            for path, future in futures:
+                if not future.result():
+                    self._failed_paths.add(path)
+    
+    def _submit_write(self, csv_path: str):
+        """Hand a CSV file's buffered games to the background writer (caller holds _write_lock)."""
+        frames = self._pending.pop(csv_path, None)
+        if frames:
+            self._write_futures.append((csv_path, self._writer.submit(self._append_frames, csv_path, frames)))
+    
+    def _append_frames(self, csv_path: str, frames: List[pd.DataFrame]) -> bool:
+        """Append game frames to a CSV file in one write (runs on the writer thread)."""
         try:
-            file_exists = os.path.exists(csv_path)
-            game_data_df.to_csv(csv_path, index=False, header=not file_exists, mode='a')
+            game_data_df = pd.concat(frames, ignore_index=True)
+            before = self._file_key(csv_path)
+            game_data_df.to_csv(csv_path, index=False, header=before is None, mode='a')
+            self._extend_id_cache(csv_path, before, game_data_df)
             logger.info(f"Successfully saved {len(game_data_df)} rows to: {csv_path}")
             return True
         except Exception as e:
             logger.error(f"Error saving data to {csv_path}: {e}")
             return False
     
+    @staticmethod
+    def _file_key(csv_path: str) -> Optional[Tuple[int, int]]:
+        """(mtime_ns, size) of a file, or None if it doesn't exist."""
+        try:
+            stat = os.stat(csv_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    def _extend_id_cache(self, csv_path: str, before: Optional[Tuple[int, int]], game_data_df: pd.DataFrame):
+        """Add appended game IDs to a cached ID set that was current before the append."""
+        with self._id_cache_lock:
+            cached = self._id_cache.pop(csv_path, None)
+            if cached is None or 'GAMEID' not in game_data_df.columns:
+                return
+            key, ids = cached
+            after = self._file_key(csv_path)
+            if key == before and after is not None:
+                ids.update(game_data_df['GAMEID'].dropna().astype(str))
+                self._id_cache[csv_path] = (after, ids)
+    
     def read_csv_safely(self, csv_path: str) -> Optional[pd.DataFrame]:
         """
         Safely read CSV file.
@@ -68,9 +194,11 @@ class CSVHandler:
             DataFrame if successful, None otherwise
         """
         try:
+            # Readers must see games that are still buffered
+            self._drain(csv_path)
             if not os.path.exists(csv_path):
                 return None
-            return pd.read_csv(csv_path)
+            return pd.read_csv(csv_path, engine=self.engine)
         except Exception as e:
             logger.error(f"Error reading CSV file {csv_path}: {e}")
             return None
@@ -79,16 +207,44 @@ class CSVHandler:
         """
         Get set of existing game IDs from CSV file.
         
+        IDs are cached per file and only re-read after the file changes on disk
+        other than through this handler's appends.
+        
         Args:
             csv_path: Path to the CSV file
         
         Returns:
-            Set of existing game IDs
+            Set of existing game IDs (a copy the caller may modify)
         """
-        df = self.read_csv_safely(csv_path)
-        if df is not None and 'GAMEID' in df.columns:
-            return set(df['GAMEID'].values)
-        return set()
+        return set(self._cached_game_ids(csv_path))
+    
+    def _cached_game_ids(self, csv_path: str) -> Set[str]:
+        """Shared cached ID set for a CSV file, re-read only if the file changed; callers must not modify it."""
+        self._drain(csv_path)
+        key = self._file_key(csv_path)
+        if key is None:
+            return set()
+        
+        with self._id_cache_lock:
+            cached = self._id_cache.get(csv_path)
+            if cached is not None and cached[0] == key:
+                return cached[1]
+        
+        try:
+            # Only the ID column is needed; read it as text so it compares equal to URL-derived IDs
+            ids = set()
+            for chunk in pd.read_csv(csv_path, usecols=['GAMEID'], dtype=str, chunksize=CSV_READ_CHUNK_ROWS):
+                ids.update(chunk['GAMEID'].dropna())
+        except ValueError:
+            # File has no GAMEID column
+            return set()
+        except Exception as e:
+            logger.warning(f"Error reading CSV file {csv_path}: {e}")
+            return set()
+        
+        with self._id_cache_lock:
+            self._id_cache[csv_path] = (key, ids)
+        return ids
     
     def validate_csv_structure(self, csv_path: str) -> bool:
         """
@@ -122,12 +278,28 @@ class CSVHandler:
         if df is None or 'GAMELINK' not in df.columns:
             return None
         
-        game_rows = df[df['GAMELINK'] == game_link].copy()
+        game_rows = df[df['GAMELINK'] == game_link]
         if game_rows.empty:
             return None
         
         return game_rows
     
+    def get_games_by_link(self, csv_path: str) -> Dict[str, pd.DataFrame]:
+        """
+        Read a CSV file once and group its rows by game link.
+        
+        Args:
+            csv_path: Path to the CSV file
+        
+        Returns:
+            Dictionary mapping game link to its rows (empty if the file is missing or invalid)
+        """
+        df = self.read_csv_safely(csv_path)
+        if df is None or 'GAMELINK' not in df.columns:
+            return {}
+        
+        return {game_link: rows for game_link, rows in df.groupby('GAMELINK', sort=False)}
+    
     def update_duplicate_flag(self, csv_path: str, game_link: str, duplicate_value: bool = True) -> bool:
         """
         Update DUPLICATE_ACROSS_DIVISIONS flag for a game in CSV file.
@@ -141,26 +313,67 @@ class CSVHandler:
             True if successful, False otherwise
         """
         try:
-            df = self.read_csv_safely(csv_path)
-            if df is None:
-                return False
-            
-            if 'GAMELINK' not in df.columns:
-                return False
-            
-            # Ensure DUPLICATE_ACROSS_DIVISIONS column exists
-            if 'DUPLICATE_ACROSS_DIVISIONS' not in df.columns:
-                df['DUPLICATE_ACROSS_DIVISIONS'] = False
-            
-            # Update rows for this game
-            mask = df['GAMELINK'] == game_link
-            df.loc[mask, 'DUPLICATE_ACROSS_DIVISIONS'] = duplicate_value
-            
-            # Save updated CSV
-            df.to_csv(csv_path, index=False)
+            with self._write_lock:
+                df = self.read_csv_safely(csv_path)
+                if df is None:
+                    return False
+                
+                if 'GAMELINK' not in df.columns:
+                    return False
+                
+                # Ensure DUPLICATE_ACROSS_DIVISIONS column exists
+                if 'DUPLICATE_ACROSS_DIVISIONS' not in df.columns:
+                    df['DUPLICATE_ACROSS_DIVISIONS'] = False
+                
+                # Update rows for this game
+                mask = df['GAMELINK'] == game_link
+                df.loc[mask, 'DUPLICATE_ACROSS_DIVISIONS'] = duplicate_value
+                
+                # Save updated CSV
+                self._replace_csv(csv_path, df)
             logger.info(f"Updated DUPLICATE_ACROSS_DIVISIONS flag for game {game_link} in {csv_path}")
             return True
             
         except Exception as e:
             logger.error(f"Error updating duplicate flag in {csv_path}: {e}")
-            return False
\ No newline at end of file
+            return False
+    
+    def mark_duplicate_games(self, csv_path: str, game_links: List[str]) -> Optional[pd.DataFrame]:
+        """
+        Set DUPLICATE_ACROSS_DIVISIONS on several games with one read and one write.
+        
+        Args:
+            csv_path: Path to the CSV file
+            game_links: Game links to mark as duplicates
+        
+        Returns:
+            The marked rows (flag set), or None if the file could not be read or updated
+        """
+        try:
+            with self._write_lock:
+                df = self.read_csv_safely(csv_path)
+                if df is None or 'GAMELINK' not in df.columns:
+                    return None
+                
+                mask = df['GAMELINK'].isin(game_links)
+                if not mask.any():
+                    return df.iloc[0:0]
+                
+                # Ensure DUPLICATE_ACROSS_DIVISIONS column exists
+                if 'DUPLICATE_ACROSS_DIVISIONS' not in df.columns:
+                    df['DUPLICATE_ACROSS_DIVISIONS'] = False
+                
+                df.loc[mask, 'DUPLICATE_ACROSS_DIVISIONS'] = True
+                self._replace_csv(csv_path, df)
+            logger.info(f"Updated DUPLICATE_ACROSS_DIVISIONS flag for {int(mask.sum())} rows in {csv_path}")
+            return df.loc[mask]
+            
+        except Exception as e:
+            logger.error(f"Error updating duplicate flags in {csv_path}: {e}")
+            return None
+    
+    def _replace_csv(self, csv_path: str, df: pd.DataFrame):
+        """Rewrite a CSV file atomically so concurrent readers (e.g. uploads) never see it half-written."""
+        tmp_path = f"{csv_path}.tmp"
+        df.to_csv(tmp_path, index=False)
+        os.replace(tmp_path, csv_path)
\ No newline at end of file
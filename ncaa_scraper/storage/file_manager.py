@@ -2,7 +2,7 @@
 
 import os
 import logging
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -13,6 +13,8 @@ class FileManager:
     
     def __init__(self, base_output_dir: str = "scraped_data"):
         self.base_output_dir = base_output_dir
+        # CSV paths already resolved (and their directories created), keyed by date/gender/division
+        self._csv_paths: Dict[Tuple[str, str, str, str, str], str] = {}
     
     def create_directory_structure(self, year: str, month: str, gender: str, division: str) -> str:
         """
@@ -45,12 +47,17 @@ class FileManager:
         Returns:
             Full path to the CSV file
         """
-        # Create directory structure
-        dir_path = self.create_directory_structure(year, month, gender, division)
-        
-        # Generate filename
-        filename = f"basketball_{gender}_{division}_{year}_{month}_{day}.csv"
-        return os.path.join(dir_path, filename)
+        key = (year, month, day, gender, division)
+        csv_path = self._csv_paths.get(key)
+        if csv_path is None:
+            # Create directory structure
+            dir_path = self.create_directory_structure(year, month, gender, division)
+            
+            # Generate filename
+            filename = f"basketball_{gender}_{division}_{year}_{month}_{day}.csv"
+            csv_path = os.path.join(dir_path, filename)
+            self._csv_paths[key] = csv_path
+        return csv_path
     
     def file_exists_and_has_content(self, file_path: str) -> bool:
         """
@@ -62,7 +69,11 @@ class FileManager:
         Returns:
             True if file exists and has content, False otherwise
         """
-        return os.path.exists(file_path) and os.path.getsize(file_path) > 0
+        try:
+            # One stat call instead of exists() followed by getsize()
+            return os.stat(file_path).st_size > 0
+        except OSError:
+            return False
     
     def ensure_directory_exists(self, directory_path: str) -> None:
         """
@@ -0,0 +1,115 @@
+"""On-disk cache of parsed games for the NCAA scraper."""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional, Tuple
+
+import pandas as pd
+
+from ..models import TeamData
+
+logger = logging.getLogger(__name__)
+
+
+class GameCache:
+    """
+    SQLite cache of parsed team stats keyed by game link.
+    
+    Games are final once scraped, so a re-run (e.g. after a crash or for another
+    division) can rebuild a game from the cache instead of fetching its page again.
+    """
+    
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        
+        try:
+            os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+            # One connection shared by all scraping threads, serialized by the lock
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            with self._lock:
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS games ("
+                    "game_link TEXT PRIMARY KEY, teams TEXT NOT NULL, scraped_at REAL NOT NULL)"
+                )
+                self._conn.commit()
+        except Exception as e:
+            logger.warning(f"Game cache disabled, could not open {db_path}: {e}")
+            self._conn = None
+    
+    def get_teams(self, game_link: str) -> Optional[Tuple[TeamData, TeamData]]:
+        """
+        Get a cached game's team data.
+        
+        Args:
+            game_link: Game link to look up
+        
+        Returns:
+            Tuple of (team one, team two) data, or None if the game isn't cached
+        """
+        if self._conn is None:
+            return None
+        
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT teams FROM games WHERE game_link = ?", (game_link,)
+                ).fetchone()
+            if row is None:
+                return None
+            
+            team_one, team_two = (
+                TeamData(
+                    team_name=team['team_name'],
+                    opponent_name=team['opponent_name'],
+                    game_id=team['game_id'],
+                    game_link=team['game_link'],
+                    stats=pd.DataFrame(team['stats'])
+                )
+                for team in json.loads(row[0])
+            )
+            return team_one, team_two
+        except Exception as e:
+            logger.warning(f"Error reading cached game {game_link}: {e}")
+            return None
+    
+    def put_teams(self, game_link: str, team_one: TeamData, team_two: TeamData) -> bool:
+        """
+        Cache a game's team data.
+        
+        Args:
+            game_link: Game link the data was scraped from
+            team_one: First team's data
+            team_two: Second team's data
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        if self._conn is None:
+            return False
+        
+        try:
+            teams = json.dumps([team_one.to_dict(), team_two.to_dict()])
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO games (game_link, teams, scraped_at) VALUES (?, ?, ?)",
+                    (game_link, teams, time.time())
+                )
+                self._conn.commit()
+            return True
+        except Exception as e:
+            logger.warning(f"Error caching game {game_link}: {e}")
+            return False
+    
+    def close(self):
+        """Close the cache database."""
+        if self._conn is not None:
+            with self._lock:
+                self._conn.close()
+                self._conn = None
@@ -3,24 +3,48 @@
 import os
 import pickle
 import logging
-from typing import Optional
+import re
+import threading
+from typing import Dict, List, Optional, Set, Tuple
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaFileUpload
 
-from ..config.constants import GOOGLE_DRIVE_SCOPES
+from ..config.constants import GOOGLE_DRIVE_SCOPES, GDRIVE_RESUMABLE_THRESHOLD
 
 logger = logging.getLogger(__name__)
 
+FOLDER_MIME_TYPE = 'application/vnd.google-apps.folder'
+CSV_NAME_PATTERN = re.compile(r'^basketball_(men|women)_(d\d)_(\d{4})_(\d{2})_(\d{2})\.csv$')
+
 
 class GoogleDriveManager:
     """Manages Google Drive operations for the scraper."""
     
     def __init__(self, config):
         self.config = config
-        self.service = None
+        self._creds = None
+        self._local = threading.local()
+        # Serializes find-or-create so concurrent uploads don't create duplicate folders
+        self._folder_lock = threading.Lock()
+        # (year, month, gender, division) -> {file name: file ID}, listed once per run
+        self._month_files: Dict[Tuple[str, str, str, str], Dict[str, str]] = {}
+        self._month_files_lock = threading.Lock()
+    
+    @property
+    def service(self):
+        """Drive API service for the calling thread (httplib2 connections are not thread-safe)."""
+        service = getattr(self._local, 'service', None)
+        if service is None and self._creds is not None:
+            service = build('drive', 'v3', credentials=self._creds)
+            self._local.service = service
+        return service
+    
+    @service.setter
+    def service(self, value):
+        self._local.service = value
     
     def authenticate(self) -> bool:
         """
@@ -56,6 +80,7 @@ class GoogleDriveManager:
                 with open(self.config.token_file, 'wb') as token:
                     pickle.dump(creds, token)
             
+            self._creds = creds
             self.service = build('drive', 'v3', credentials=creds)
             logger.info("Successfully authenticated with Google Drive")
             return True
@@ -198,7 +223,9 @@ class GoogleDriveManager:
             else:
                 existing_file_id = self.file_exists(file_name, folder_id)
             
-            media = MediaFileUpload(file_path, resumable=True)
+            # A resumable session costs an extra round trip; daily CSVs fit in one multipart request
+            resumable = os.path.getsize(file_path) > GDRIVE_RESUMABLE_THRESHOLD
+            media = MediaFileUpload(file_path, resumable=resumable, chunksize=-1)
             
             if existing_file_id:
                 # Update existing file
@@ -327,13 +354,14 @@ class GoogleDriveManager:
         Returns:
             Google Drive folder ID if successful, None if failed
         """
-        # Try to find existing folder first
-        folder_id = self.find_folder(folder_name, parent_folder_id)
-        if folder_id:
-            return folder_id
-        
-        # Create new folder if not found
-        return self.create_folder(folder_name, parent_folder_id)
+        with self._folder_lock:
+            # Try to find existing folder first
+            folder_id = self.find_folder(folder_name, parent_folder_id)
+            if folder_id:
+                return folder_id
+            
+            # Create new folder if not found
+            return self.create_folder(folder_name, parent_folder_id)
     
     def create_folder_structure(self, year: str, month: str, gender: str, division: str, base_folder_id: Optional[str] = None) -> Optional[str]:
         """
@@ -391,6 +419,110 @@ class GoogleDriveManager:
             logger.error(f"Failed to create Google Drive folder structure: {e}")
             return None
     
+    def find_folder_structure(self, year: str, month: str, gender: str, division: str, base_folder_id: Optional[str] = None) -> Optional[str]:
+        """
+        Look up the output_dir_name/year/month/gender/division folder without creating anything.
+        
+        Args:
+            year: Year (e.g., "2025")
+            month: Month (e.g., "01")
+            gender: Gender (e.g., "men", "women")
+            division: Division (e.g., "d1", "d2", "d3")
+            base_folder_id: Optional base folder ID the structure lives under
+        
+        Returns:
+            Division folder ID if the whole structure exists, None otherwise
+        """
+        output_dir_name = os.path.basename(self.config.output_dir) or "scraped_data"
+        
+        folder_id = base_folder_id
+        for folder_name in (output_dir_name, year, month, gender, division):
+            folder_id = self.find_folder(folder_name, folder_id)
+            if not folder_id:
+                return None
+        
+        return folder_id
+    
+    def _list_children(self, parent_ids: List[str], extra_query: str, fields: str = "id, name") -> List[dict]:
+        """
+        List non-trashed items under any of the given parents with a single paged query.
+        
+        Args:
+            parent_ids: Parent folder IDs
+            extra_query: Additional Drive query clause
+            fields: File fields to return
+        
+        Returns:
+            List of file metadata dictionaries
+        """
+        if not parent_ids:
+            return []
+        
+        parents = " or ".join(f"'{parent_id}' in parents" for parent_id in parent_ids)
+        query = f"({parents}) and trashed=false and {extra_query}"
+        
+        files = []
+        page_token = None
+        while True:
+            results = self.service.files().list(
+                q=query,
+                fields=f"nextPageToken, files({fields})",
+                pageSize=1000,
+                pageToken=page_token,
+                supportsAllDrives=True,
+                includeItemsFromAllDrives=True
+            ).execute()
+            files.extend(results.get('files', []))
+            page_token = results.get('nextPageToken')
+            if not page_token:
+                return files
+    
+    def list_existing_files(self, year: str, month: str) -> Optional[Set[Tuple[str, str, str, str, str]]]:
+        """
+        List every scraped CSV already in Google Drive for a month in a few bulk queries.
+        
+        Args:
+            year: Year (e.g., "2025")
+            month: Month (e.g., "02")
+        
+        Returns:
+            Set of (year, month, day, gender, division) tuples, or None on error
+        """
+        try:
+            if not self.service:
+                if not self.authenticate():
+                    return None
+            
+            output_dir_name = os.path.basename(self.config.output_dir) or "scraped_data"
+            
+            folder_id = self.config.google_drive_folder_id
+            for folder_name in (output_dir_name, year, month):
+                folder_id = self.find_folder(folder_name, folder_id)
+                if not folder_id:
+                    return set()
+            
+            # month -> gender folders -> division folders -> CSV files
+            folder_query = f"mimeType='{FOLDER_MIME_TYPE}'"
+            gender_ids = [f['id'] for f in self._list_children([folder_id], folder_query)]
+            division_ids = [f['id'] for f in self._list_children(gender_ids, folder_query)]
+            # Drive's 'contains' only matches name prefixes, so the date is checked locally
+            files = self._list_children(division_ids, "name contains 'basketball_'", fields="name")
+            
+            existing = set()
+            for file in files:
+                match = CSV_NAME_PATTERN.match(file.get('name', ''))
+                if match:
+                    gender, division, file_year, file_month, day = match.groups()
+                    if (file_year, file_month) != (year, month):
+                        continue
+                    existing.add((file_year, file_month, day, gender, division))
+            
+            return existing
+            
+        except Exception as e:
+            logger.error(f"Failed to list existing Google Drive files for {year}-{month}: {e}")
+            return None
+    
     def get_upload_stats(self, folder_id: Optional[str] = None) -> dict:
         """
         Get statistics about files in a Google Drive folder.
@@ -450,6 +582,44 @@ class GoogleDriveManager:
             logger.error(f"Failed to get upload stats: {e}")
             return {}
     
+    def _list_month_files(self, year: str, month: str, gender: str, division: str) -> Dict[str, str]:
+        """
+        List the CSVs in a gender/division month folder, querying Drive only once per folder.
+        
+        The listing is a snapshot from the first call; each day's file is checked
+        before that day is scraped and uploaded, so later uploads never need to be seen.
+        
+        Args:
+            year: Year (e.g., "2025")
+            month: Month (e.g., "02")
+            gender: Gender (e.g., "women")
+            division: Division (e.g., "d3")
+        
+        Returns:
+            Dictionary mapping file name to Google Drive file ID
+        
+        Raises:
+            Exception: Propagates Drive API errors so failed listings are not cached
+        """
+        key = (year, month, gender, division)
+        with self._month_files_lock:
+            cached = self._month_files.get(key)
+        if cached is not None:
+            return cached
+        
+        folder_id = self.find_folder_structure(
+            year, month, gender, division, self.config.google_drive_folder_id
+        )
+        files = {}
+        if folder_id:
+            for file in self._list_children(
+                [folder_id], f"name contains 'basketball_{gender}_{division}_{year}_{month}_'"
+            ):
+                files.setdefault(file['name'], file['id'])
+        
+        with self._month_files_lock:
+            return self._month_files.setdefault(key, files)
+    
     def check_file_exists_in_gdrive(self, year: str, month: str, gender: str, division: str, day: str = None) -> tuple[bool, Optional[str]]:
         """
         Check if a file already exists in Google Drive for the given parameters.
@@ -469,19 +639,19 @@ class GoogleDriveManager:
                 if not self.authenticate():
                     return False, None
             
-            # Create folder structure to get the target folder ID
-            folder_id = self.create_folder_structure(
+            if day:
+                # Answer per-day checks from one listing of the month's folder
+                file_name = f"basketball_{gender}_{division}_{year}_{month}_{day}.csv"
+                existing_file_id = self._list_month_files(year, month, gender, division).get(file_name)
+                return existing_file_id is not None, existing_file_id
+            
+            # Look up the target folder; if it doesn't exist, neither can the file
+            folder_id = self.find_folder_structure(
                 year, month, gender, division, self.config.google_drive_folder_id
             )
             
             if not folder_id:
                 return False, None
-            
-            if day:
-                # Check for specific day file
-                file_name = f"basketball_{gender}_{division}_{year}_{month}_{day}.csv"
-                existing_file_id = self.file_exists(file_name, folder_id)
-                return existing_file_id is not None, existing_file_id
             else:
                 # Check for any files in the month folder
                 query = f"'{folder_id}' in parents and trashed=false and name contains 'basketball_{gender}_{division}_{year}_{month}'"
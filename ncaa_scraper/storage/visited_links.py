@@ -0,0 +1,100 @@
+"""Persistent record of which division each game link was scraped in."""
+
+import logging
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Read the table through a memory map instead of read() calls (256 MB covers any season)
+MMAP_SIZE = 256 * 1024 * 1024
+
+
+class VisitedLinksStore:
+    """
+    SQLite table of game link -> division, kept across runs.
+    
+    Lets a later run recognize a game already scraped for another division and copy
+    it instead of scraping it again.
+    """
+    
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        
+        try:
+            os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            with self._lock:
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+                self._conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS visited (link TEXT PRIMARY KEY, division TEXT NOT NULL)"
+                )
+                self._conn.commit()
+        except Exception as e:
+            logger.warning(f"Visited links store disabled, could not open {db_path}: {e}")
+            self._conn = None
+    
+    def get_divisions(self, links: Iterable[str]) -> Dict[str, str]:
+        """
+        Look up the divisions that game links were scraped in.
+        
+        Args:
+            links: Game links to look up
+        
+        Returns:
+            Dict of game link to division, for the links that have been visited
+        """
+        if self._conn is None:
+            return {}
+        
+        try:
+            divisions = {}
+            with self._lock:
+                for link in links:
+                    row = self._conn.execute(
+                        "SELECT division FROM visited WHERE link = ?", (link,)
+                    ).fetchone()
+                    if row is not None:
+                        divisions[link] = row[0]
+            return divisions
+        except Exception as e:
+            logger.warning(f"Error reading visited links: {e}")
+            return {}
+    
+    def add(self, link: str, division: str) -> bool:
+        """
+        Record the division a game link was scraped in.
+        
+        Args:
+            link: Game link
+            division: Division (d1, d2, d3)
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        if self._conn is None:
+            return False
+        
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO visited (link, division) VALUES (?, ?)", (link, division)
+                )
+                self._conn.commit()
+            return True
+        except Exception as e:
+            logger.warning(f"Error recording visited link {link}: {e}")
+            return False
+    
+    def close(self):
+        """Close the store's database."""
+        if self._conn is not None:
+            with self._lock:
+                self._conn.close()
+                self._conn = None
@@ -1,11 +1,14 @@
 """Utility functions for the NCAA scraper."""
 
 from .date_utils import get_yesterday, format_date_for_url, parse_date_from_url
-from .url_utils import generate_ncaa_urls, parse_url_components, extract_game_id_from_url
+from .url_utils import generate_ncaa_urls, generate_ncaa_urls_for_dates, parse_url_components, extract_game_id_from_url, UrlComponents
 from .validators import validate_date_string, validate_url
+from .rate_limiter import HostRateLimiter
+from .phase_timer import PhaseTimer
 
 __all__ = [
     'get_yesterday', 'format_date_for_url', 'parse_date_from_url',
-    'generate_ncaa_urls', 'parse_url_components', 'extract_game_id_from_url',
-    'validate_date_string', 'validate_url'
+    'generate_ncaa_urls', 'generate_ncaa_urls_for_dates', 'parse_url_components', 'extract_game_id_from_url', 'UrlComponents',
+    'validate_date_string', 'validate_url',
+    'HostRateLimiter', 'PhaseTimer'
 ]
@@ -0,0 +1,97 @@
+"""Per-phase timing for the NCAA scraper."""
+
+import logging
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, List
+
+try:
+    from prometheus_client import Histogram, start_http_server
+except ImportError:
+    Histogram = None
+    start_http_server = None
+
+logger = logging.getLogger(__name__)
+
+# Histogram buckets in seconds, from a cached parse to a slow browser load
+PHASE_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30)
+
+# Registered once per process: Prometheus rejects duplicate metric names
+PHASE_HISTOGRAM = Histogram(
+    "ncaa_scrape_phase_seconds", "Time spent in each scraping phase",
+    ["phase"], buckets=PHASE_BUCKETS
+) if Histogram is not None else None
+
+
+class PhaseTimer:
+    """
+    Collects how long each scraping phase takes, across all worker threads.
+    
+    Durations are kept in memory for a summary log line per phase. When
+    prometheus_client is installed they are also exported as a histogram.
+    """
+    
+    def __init__(self):
+        self._durations: Dict[str, List[float]] = defaultdict(list)
+        self._lock = threading.Lock()
+    
+    @contextmanager
+    def time(self, phase: str):
+        """
+        Time the enclosed block as one run of a phase.
+        
+        Args:
+            phase: Phase name (e.g. "http_fetch", "parse")
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, time.perf_counter() - start)
+    
+    def record(self, phase: str, seconds: float):
+        """
+        Record one run of a phase.
+        
+        Args:
+            phase: Phase name
+            seconds: Duration in seconds
+        """
+        with self._lock:
+            self._durations[phase].append(seconds)
+        if PHASE_HISTOGRAM is not None:
+            PHASE_HISTOGRAM.labels(phase).observe(seconds)
+    
+    def start_server(self, port: int) -> bool:
+        """
+        Serve the phase histogram for Prometheus to scrape.
+        
+        Args:
+            port: Port for the metrics endpoint
+        
+        Returns:
+            True if the endpoint was started, False if prometheus_client is not installed
+        """
+        if start_http_server is None:
+            logger.warning("prometheus_client is not installed, phase metrics will only be logged")
+            return False
+        
+        start_http_server(port)
+        logger.info(f"Serving phase metrics on port {port}")
+        return True
+    
+    def log_summary(self):
+        """Log count, median, 95th percentile and max duration of every phase."""
+        with self._lock:
+            durations = {phase: sorted(values) for phase, values in self._durations.items()}
+        
+        for phase, values in sorted(durations.items()):
+            count = len(values)
+            p50 = values[count // 2]
+            p95 = values[min(count - 1, int(count * 0.95))]
+            logger.info(
+                f"Phase {phase}: {count} runs, total {sum(values):.1f}s, "
+                f"p50 {p50:.3f}s, p95 {p95:.3f}s, max {values[-1]:.3f}s"
+            )
@@ -0,0 +1,45 @@
+"""Per-host request throttling for the NCAA scraper."""
+
+import threading
+import time
+from typing import Dict
+from urllib.parse import urlparse
+
+
+class HostRateLimiter:
+    """
+    Token bucket per host shared by all scraping threads.
+    
+    Each host may receive ``rate`` requests per second on average, with bursts
+    of up to ``burst`` requests, however many workers are fetching pages.
+    """
+    
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        # host -> (available tokens, time of last refill)
+        self._buckets: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+    
+    def acquire(self, url: str):
+        """
+        Block until a request to the URL's host is allowed.
+        
+        Args:
+            url: URL about to be requested
+        """
+        if self.rate <= 0:
+            return
+        
+        host = urlparse(url).netloc
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                tokens, last = self._buckets.get(host, (float(self.burst), now))
+                tokens = min(float(self.burst), tokens + (now - last) * self.rate)
+                if tokens >= 1:
+                    self._buckets[host] = (tokens - 1, now)
+                    return
+                self._buckets[host] = (tokens, now)
+                wait = (1 - tokens) / self.rate
+            time.sleep(wait)
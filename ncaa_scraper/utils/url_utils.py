@@ -1,15 +1,40 @@
 """URL utility functions for the NCAA scraper."""
 
-from typing import List, Dict, Any
-from urllib.parse import urlparse, parse_qs, urlencode
-from datetime import datetime
+from functools import lru_cache
+from itertools import product
+from typing import Iterable, List, Any, NamedTuple
+from urllib.parse import urlparse, parse_qs, urlencode, quote_plus
+from datetime import date, datetime
 import logging
+import re
 
 from ..config.constants import NCAA_BASE_URL, Division, Gender
 
 logger = logging.getLogger(__name__)
 
 
+GENDER_TO_SPORT = {
+    Gender.WOMEN: 'WBB',
+    Gender.MEN: 'MBB'
+}
+
+DIVISION_TO_NUM = {
+    Division.D1: '1',
+    Division.D2: '2',
+    Division.D3: '3'
+}
+
+_DATE_PLACEHOLDER = '__GAME_DATE__'
+
+# A stats.ncaa.org scoreboard URL with non-empty sport_code, division and game_date parameters
+SCOREBOARD_URL_PATTERN = re.compile(
+    r'^https?://[^/?#]*stats\.ncaa\.org[^/?#]*/contests/livestream_scoreboards/?\?'
+    r'(?=(?:[^#]*&)?sport_code=[^&#])'
+    r'(?=(?:[^#]*&)?division=[^&#])'
+    r'(?=(?:[^#]*&)?game_date=[^&#])'
+)
+
+
 def generate_ncaa_urls(
     date_str: str,
     divisions: List[Division] = None,
@@ -26,53 +51,75 @@ def generate_ncaa_urls(
     Returns:
         List of stats.ncaa.org scoreboard URLs
     """
+    date_obj = datetime.strptime(date_str, '%Y/%m/%d').date()
+    return generate_ncaa_urls_for_dates([date_obj], divisions, genders)
+
+
+def generate_ncaa_urls_for_dates(
+    dates: Iterable[date],
+    divisions: List[Division] = None,
+    genders: List[Gender] = None
+) -> List[str]:
+    """
+    Generate stats.ncaa.org scoreboard URLs for several dates.
+    
+    The query string for each division/gender pair is encoded once and only the
+    game date is substituted per date.
+    
+    Args:
+        dates: Dates to generate URLs for
+        divisions: List of divisions to scrape
+        genders: List of genders to scrape
+    
+    Returns:
+        List of stats.ncaa.org scoreboard URLs, grouped by date in the given order
+    """
     if divisions is None:
         divisions = [Division.D3]
     if genders is None:
         genders = [Gender.WOMEN]
     
-    # Parse the input date (YYYY/MM/DD) and convert to MM/DD/YYYY
-    date_obj = datetime.strptime(date_str, '%Y/%m/%d').date()
-    game_date = date_obj.strftime('%m/%d/%Y')
-    
-    # Map gender to sport code
-    gender_to_sport = {
-        Gender.WOMEN: 'WBB',
-        Gender.MEN: 'MBB'
-    }
-    
-    # Map division to number
-    division_to_num = {
-        Division.D1: '1',
-        Division.D2: '2',
-        Division.D3: '3'
-    }
+    templates = [
+        f"{NCAA_BASE_URL}?" + urlencode({
+            'utf8': '✓',  # URL encoded as %E2%9C%93
+            'sport_code': GENDER_TO_SPORT[gender],
+            'division': DIVISION_TO_NUM[division],
+            'game_date': _DATE_PLACEHOLDER,
+            'commit': 'Submit'
+        })
+        for gender, division in product(genders, divisions)
+    ]
     
     urls = []
-    for gender in genders:
-        for division in divisions:
-            params = {
-                'utf8': '✓',  # URL encoded as %E2%9C%93
-                'sport_code': gender_to_sport[gender],
-                'division': division_to_num[division],
-                'game_date': game_date,
-                'commit': 'Submit'
-            }
-            url = f"{NCAA_BASE_URL}?{urlencode(params)}"
-            urls.append(url)
+    for day in dates:
+        # MM/DD/YYYY, encoded the same way urlencode would
+        game_date = quote_plus(day.strftime('%m/%d/%Y'))
+        urls.extend(template.replace(_DATE_PLACEHOLDER, game_date) for template in templates)
     
     return urls
 
 
-def parse_url_components(url: str) -> Dict[str, str]:
+class UrlComponents(NamedTuple):
+    """Components parsed from a stats.ncaa.org scoreboard URL."""
+    gender: str
+    division: str
+    year: str
+    month: str
+    day: str
+
+
+@lru_cache(maxsize=4096)
+def parse_url_components(url: str) -> UrlComponents:
     """
     Parse stats.ncaa.org URL to extract components.
     
+    Results are cached, since the same URLs are parsed at several stages of a run.
+    
     Args:
         url: stats.ncaa.org scoreboard URL
     
     Returns:
-        Dictionary with parsed components (gender, division, year, month, day)
+        UrlComponents with gender, division, year, month and day
     """
     try:
         parsed = urlparse(url)
@@ -101,13 +148,13 @@ def parse_url_components(url: str) -> Dict[str, str]:
         
         date_obj = datetime.strptime(game_date, '%m/%d/%Y').date()
         
-        return {
-            'gender': gender,
-            'division': division,
-            'year': str(date_obj.year),
-            'month': f"{date_obj.month:02d}",
-            'day': f"{date_obj.day:02d}"
-        }
+        return UrlComponents(
+            gender=gender,
+            division=division,
+            year=str(date_obj.year),
+            month=f"{date_obj.month:02d}",
+            day=f"{date_obj.day:02d}"
+        )
     except Exception as e:
         logger.error(f"Failed to parse URL components from {url}: {e}")
         raise ValueError(f"Invalid URL format: {url}")
@@ -115,29 +162,12 @@ def parse_url_components(url: str) -> Dict[str, str]:
 
 def validate_url(url: str) -> bool:
     """Validate if URL is a valid stats.ncaa.org scoreboard URL."""
-    try:
-        parsed = urlparse(url)
-        if not parsed.scheme or not parsed.netloc:
-            return False
-        
-        # Check if it's stats.ncaa.org
-        if 'stats.ncaa.org' not in parsed.netloc:
-            return False
-        
-        # Check if it's a livestream_scoreboards URL
-        if '/contests/livestream_scoreboards' not in parsed.path:
-            return False
-        
-        # Check for required parameters
-        params = parse_qs(parsed.query)
-        required = ['sport_code', 'division', 'game_date']
-        return all(param in params for param in required)
-    except Exception:
-        return False
+    return bool(SCOREBOARD_URL_PATTERN.match(url))
 
 
+@lru_cache(maxsize=4096)
 def extract_game_id_from_url(url: str) -> str:
-    """Extract contest ID from game URL."""
+    """Extract contest ID from game URL (cached; links are looked up repeatedly)."""
     # URL format: https://stats.ncaa.org/contests/6458485/individual_stats
     # or: https://stats.ncaa.org/contests/6458485
     parts = url.rstrip('/').split('/')